@@ -8,7 +8,8 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 
 from .constants import Months
-from .models import Day, Slot
+from .models import AvailabilityJob, Day, Slot
+from .repository import DjangoAvailabilityRepository
 
 
 class SlotInlineAdmin(admin.StackedInline):
@@ -77,6 +78,16 @@ class DayAdmin(admin.ModelAdmin):
             del actions['delete_selected']
         return actions
 
+    def save_formset(self, request: HttpRequest, form, formset, change: bool):
+        super().save_formset(request, form, formset, change)
+        day = form.instance
+        DjangoAvailabilityRepository.refresh_days_masks(day_ids=[day.id])
+        DjangoAvailabilityRepository.refresh_days_summaries(
+            boat_id=day.definition.boat_id,
+            from_=day.date,
+            to=day.date
+        )
+
     def get_slots(self, obj: Day) -> str:
         slots_html = ''
         url = reverse(
@@ -124,3 +135,29 @@ class DayAdmin(admin.ModelAdmin):
 
 
 admin.site.register(Day, DayAdmin)
+
+
+class AvailabilityJobAdmin(admin.ModelAdmin):
+    list_filter = ('status', 'action', 'year', 'boat')
+    list_display = (
+        'boat',
+        'action',
+        'year',
+        'status',
+        'created',
+        'started',
+        'finished',
+    )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(
+        self,
+        request: HttpRequest,
+        obj: AvailabilityJob = None
+    ) -> bool:
+        return False
+
+
+admin.site.register(AvailabilityJob, AvailabilityJobAdmin)
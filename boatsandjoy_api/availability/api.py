@@ -1,22 +1,25 @@
-from copy import deepcopy
 from datetime import date
 from decimal import Decimal
-from typing import List, Type
+from typing import Dict, Iterator, List, Sequence, Tuple, Type
 
-from boatsandjoy_api.availability.exceptions import (
-    NoAvailabilityForDay,
-    NoDayDefinitionDefined,
-)
+from django.conf import settings
+
+from boatsandjoy_api.availability.exceptions import NoAvailabilityForDay
 from boatsandjoy_api.boats.api import api as boats_api
 from boatsandjoy_api.boats.domain import Boat
 from boatsandjoy_api.boats.exceptions import NoActiveBoat
-from boatsandjoy_api.boats.requests import FilterBoatsRequest
-from boatsandjoy_api.core.exceptions import BoatsAndJoyException
+from boatsandjoy_api.core.exceptions import (
+    BoatsAndJoyException,
+    InvalidDataError,
+)
 from boatsandjoy_api.core.responses import (
+    ErrorResponseBuilder,
     ResponseBuilder,
     ResponseBuilderInterface,
+    StreamResponseBuilder,
 )
 from . import domain
+from .caches import DayAvailabilityCacheInterface, DjangoDayAvailabilityCache
 from .constants import DayAvailabilityTypes
 from .exceptions import (
     AvailabilityApiException,
@@ -24,12 +27,21 @@ from .exceptions import (
     NoSameDaySlots,
     NoSlotsAvailable,
 )
-from .repository import AvailabilityRepository, DjangoAvailabilityRepository
-from .requests import GetDayAvailabilityRequest, GetMonthAvailabilityRequest
-from .utils import month_date_iter
+from .repository import (
+    AvailabilityRepository,
+    DerivedSlotsAvailabilityRepository,
+    DjangoAvailabilityRepository,
+)
+from .requests import (
+    GetDayAvailabilityRequest,
+    GetMonthAvailabilityRequest,
+    GetRangeAvailabilityRequest,
+)
+from .utils import get_slots_timings, month_date_iter
 from .validators import (
     GetAvailabilityRequestValidator,
     GetMonthAvailabilityRequestValidator,
+    GetRangeAvailabilityRequestValidator,
 )
 
 
@@ -38,9 +50,15 @@ class AvailabilityApi:
         self,
         availability_repository: Type[AvailabilityRepository],
         response_builder: Type[ResponseBuilderInterface],
+        error_builder: Type[ResponseBuilderInterface],
+        stream_response_builder: Type[ResponseBuilderInterface],
+        day_availability_cache: Type[DayAvailabilityCacheInterface],
     ):
         self.availability_repository = availability_repository
         self.response_builder = response_builder
+        self.error_builder = error_builder
+        self.stream_response_builder = stream_response_builder
+        self.day_availability_cache = day_availability_cache
 
     def get_day_availability(self, request: GetDayAvailabilityRequest) -> dict:
         """
@@ -65,18 +83,66 @@ class AvailabilityApi:
         """
         try:
             GetAvailabilityRequestValidator.validate(request)
-            results = boats_api.filter(FilterBoatsRequest(active=True))
-            boats = [Boat(**boat_data) for boat_data in results['data']]
+            cache_key = self.day_availability_cache.get_key(
+                date_=request.date,
+                apply_resident_discount=request.apply_resident_discount,
+            )
+            response = self.day_availability_cache.get(cache_key)
+            if response is not None:
+                return response
+            boats = boats_api.get_active_boats()
             availablity_results = self._get_day_availability(
                 boats=boats,
                 date_=request.date,
                 apply_resident_discount=request.apply_resident_discount,
             )
-            return self.response_builder(availablity_results).build()
+            response = self.response_builder(availablity_results).build()
+            self.day_availability_cache.set(cache_key, response)
+            return response
 
         except AvailabilityApiException:
             return self.response_builder([]).build()
 
+    def get_range_availability(
+        self,
+        request: GetRangeAvailabilityRequest
+    ) -> dict:
+        """
+        Day availability of every date of the range, computed lazily
+        while data is consumed from already loaded boats days
+
+        :return: {
+            'error': bool,
+            'data': iterator of [
+                {
+                    'date': date,
+                    'availability': get_day_availability data of this date
+                },
+                ...
+            ]
+        }
+        """
+        try:
+            GetRangeAvailabilityRequestValidator.validate(request)
+            boats = boats_api.get_active_boats()
+            boats_days = self.availability_repository.filter_boats_days(
+                boat_ids=[boat.id for boat in boats if boat.active],
+                from_=request.from_date,
+                to=request.to_date
+            )
+            return self.stream_response_builder(
+                self._iter_range_availability(
+                    boats=boats,
+                    boats_days=boats_days,
+                    apply_resident_discount=request.apply_resident_discount,
+                )
+            ).build()
+
+        except InvalidDataError as e:
+            return self.error_builder(e).build()
+        except AvailabilityApiException:
+            return self.response_builder([]).build()
+
     def get_month_availability(
         self,
         request: GetMonthAvailabilityRequest
@@ -96,8 +162,7 @@ class AvailabilityApi:
         """
         try:
             GetMonthAvailabilityRequestValidator.validate(request)
-            results = boats_api.filter(FilterBoatsRequest(active=True))
-            boats = [Boat(**boat_data) for boat_data in results['data']]
+            boats = boats_api.get_active_boats()
             month_availability_results = self._get_month_availability(
                 boats=boats,
                 month=request.month,
@@ -112,8 +177,43 @@ class AvailabilityApi:
 
     def _get_day_availability(
         self,
-        boats: List[Boat],
+        boats: Sequence[Boat],
+        date_: date,
+        apply_resident_discount: bool
+    ) -> list:
+        boats_days = self.availability_repository.get_boats_days(
+            boat_ids=[boat.id for boat in boats if boat.active],
+            date_=date_
+        )
+        return self._get_boats_responses(
+            boats=boats,
+            date_=date_,
+            boats_days=boats_days,
+            apply_resident_discount=apply_resident_discount,
+        )
+
+    def _iter_range_availability(
+        self,
+        boats: Sequence[Boat],
+        boats_days: Dict[date, Dict[int, domain.BoatDay]],
+        apply_resident_discount: bool
+    ) -> Iterator[dict]:
+        for date_ in sorted(boats_days):
+            yield {
+                'date': date_,
+                'availability': self._get_boats_responses(
+                    boats=boats,
+                    date_=date_,
+                    boats_days=boats_days[date_],
+                    apply_resident_discount=apply_resident_discount,
+                ),
+            }
+
+    def _get_boats_responses(
+        self,
+        boats: Sequence[Boat],
         date_: date,
+        boats_days: Dict[int, domain.BoatDay],
         apply_resident_discount: bool
     ) -> list:
         results = []
@@ -121,10 +221,14 @@ class AvailabilityApi:
             try:
                 if not boat.active:
                     raise NoActiveBoat('This boat is not active')
+                if boat.id not in boats_days:
+                    raise NoAvailabilityForDay(
+                        f'This boat has not availability for day {date_}'
+                    )
                 results.append(
                     self._get_boat_response(
                         boat,
-                        date_,
+                        boats_days[boat.id],
                         apply_resident_discount
                     )
                 )
@@ -134,7 +238,7 @@ class AvailabilityApi:
 
     def _get_month_availability(
         self,
-        boats: List[Boat],
+        boats: Sequence[Boat],
         month: int,
         year: int
     ) -> list:
@@ -143,9 +247,19 @@ class AvailabilityApi:
             DayAvailabilityTypes.NO_AVAIL,
             DayAvailabilityTypes.FULL,
         )
-        for idate in month_date_iter(year, month):
+        dates = month_date_iter(year, month)
+        days_summaries = self.availability_repository.filter_days_summaries(
+            boat_ids=[boat.id for boat in boats],
+            from_=max(dates[0], date.today()),
+            to=dates[-1]
+        )
+        for idate in dates:
             global_day_availability_type = (
-                self._get_global_day_availability_type(boats, idate)
+                self._get_global_day_availability_type(
+                    boats,
+                    idate,
+                    days_summaries
+                )
             )
             result = {
                 'date': idate,
@@ -159,20 +273,24 @@ class AvailabilityApi:
     def _get_boat_response(
         self,
         boat: Boat,
-        date_: date,
+        boat_day: domain.BoatDay,
         apply_resident_discount: bool
     ) -> dict:
-        day_definition = DjangoAvailabilityRepository.get_day_definition(
-            boat_id=boat.id,
-            date_=date_
-        )
-        day = DjangoAvailabilityRepository.get_day(boat, date_)
-        available_slots = DjangoAvailabilityRepository.get_available_slots(day)
+        day_definition = boat_day.day_definition
+        day = boat_day.day
+        date_ = day.date
+        available_slots = self.availability_repository.get_available_slots(day)
         combinations = self._get_combinations(available_slots)
         combinations_prices = self._get_combinations_prices(
-            boat,
-            day,
-            combinations
+            day_definition=day_definition,
+            price_per_hour=(
+                self.availability_repository.calculate_price_per_hour(
+                    day_definition=day_definition,
+                    price_variation=boat_day.price_variation,
+                )
+            ),
+            combinations=combinations,
+            apply_resident_discount=apply_resident_discount,
         )
         combinations_timings = self._get_combinations_timing(
             day_definition=day_definition,
@@ -195,12 +313,7 @@ class AvailabilityApi:
                         }
                         for slot in combination
                     ],
-                    'price': self._apply_discounts(
-                        combination,
-                        combinations_prices[i],
-                        day_definition,
-                        apply_resident_discount,
-                    ),
+                    'price': combinations_prices[i],
                     'from_hour': combinations_timings[i].from_hour,
                     'to_hour': combinations_timings[i].to_hour,
                 }
@@ -217,26 +330,25 @@ class AvailabilityApi:
     ) -> List[List[domain.Slot]]:
         """
         Two slots can be at the same combination just
-        if they have correlated positions into the same day
+        if they have correlated positions into the same day.
+        Combinations are every contiguous run of slots sorted by its first
+        slot and then by its length, and they share the slot objects
         """
         self._check_slots(slots)
-        slots = DjangoAvailabilityRepository.sort_slots(slots=slots)
-        combinations = []
-        for slot1 in slots:
-            combination = [slot1]
-            combinations = self._add_combination(combinations, combination)
-            aux_slot = deepcopy(slot1)
-            for slot2 in slots:
-                if aux_slot.position == slot2.position:
-                    continue
-                if aux_slot.position > slot2.position:
-                    continue
-                if abs(aux_slot.position - slot2.position) != 1:
-                    break
-                combination.append(slot2)
-                combinations = self._add_combination(combinations, combination)
-                aux_slot = deepcopy(slot2)
-        return combinations
+        slots = self.availability_repository.sort_slots(slots=slots)
+        # Index of the last slot of the contiguous run that starts at each
+        # slot, computed in a single backwards pass
+        runs_ends = [len(slots) - 1] * len(slots)
+        for i in range(len(slots) - 2, -1, -1):
+            if slots[i + 1].position - slots[i].position == 1:
+                runs_ends[i] = runs_ends[i + 1]
+            else:
+                runs_ends[i] = i
+        return [
+            slots[start:end + 1]
+            for start in range(len(slots))
+            for end in range(start, runs_ends[start] + 1)
+        ]
 
     @staticmethod
     def _check_slots(slots: List[domain.Slot]):
@@ -246,81 +358,102 @@ class AvailabilityApi:
         if any(slot.day_id != slot0_day_id for slot in slots):
             raise NoSameDaySlots('Error: Slots don\'t belong to same day')
 
-    @staticmethod
-    def _add_combination(
+    @classmethod
+    def _get_combinations_prices(
+        cls,
+        day_definition: domain.DayDefinition,
+        price_per_hour: Decimal,
         combinations: List[List[domain.Slot]],
-        combination: List[domain.Slot]
-    ) -> List[List[domain.Slot]]:
-        combinations.append(deepcopy(combination))
-        return combinations
+        apply_resident_discount: bool,
+    ) -> List[Decimal]:
+        """
+        Price only depends on combination length, so prices are computed
+        once per length and then assigned to every combination
+        """
+        prices_by_length = cls._get_prices_by_length(
+            day_definition=day_definition,
+            price_per_hour=price_per_hour,
+            max_length=max(map(len, combinations), default=0),
+            apply_resident_discount=apply_resident_discount,
+        )
+        return [
+            prices_by_length[len(combination)] for combination in combinations
+        ]
 
     @staticmethod
-    def _get_combinations_prices(
-        boat: Boat,
-        day: domain.Day,
-        combinations: List[List[domain.Slot]]
+    def _get_prices_by_length(
+        day_definition: domain.DayDefinition,
+        price_per_hour: Decimal,
+        max_length: int,
+        apply_resident_discount: bool,
     ) -> List[Decimal]:
-        day_definition = DjangoAvailabilityRepository.get_day_definition(
-            boat_id=boat.id,
-            date_=day.date
+        deal_discount = (
+            Decimal(day_definition.discount_when_deal)
+            if day_definition.discount_when_deal
+            else None
         )
-        hours_per_slot = day_definition.hours_per_slot
-        day_price_per_hour = DjangoAvailabilityRepository.get_price_per_hour(
-            boat=boat,
-            date_=day.date
+        resident_discount = (
+            Decimal(day_definition.resident_discount)
+            if apply_resident_discount
+            else None
         )
-        return [
-            len(combination) * hours_per_slot * day_price_per_hour
-            for combination in combinations
-        ]
+        prices_by_length = [None]
+        for length in range(1, max_length + 1):
+            price = length * day_definition.hours_per_slot * price_per_hour
+            if (
+                deal_discount is not None
+                and length >= day_definition.n_slots_deal_threshold
+            ):
+                price = price - price * deal_discount
+            if resident_discount is not None:
+                price = price - price * resident_discount
+            prices_by_length.append(round(price, 2))
+        return prices_by_length
 
     @staticmethod
     def _get_combinations_timing(
         day_definition: domain.DayDefinition,
         combinations: List[List[domain.Slot]],
     ) -> List[domain.SlotTiming]:
+        slots_timings = get_slots_timings(
+            first_time=day_definition.first_time,
+            hours_per_slot=day_definition.hours_per_slot
+        )
+        n_positions = len(slots_timings)
         slot_combination_hour_limits = []
         for combination in combinations:
             if len(combination) == 0:
                 raise CombinationOfSize0('Error: Combination of size 0')
-            elif len(combination) == 1:
-                slot_combination_hour_limits.append(
-                    DjangoAvailabilityRepository.get_slot_timing(
-                        day_definition=day_definition,
-                        slot=combination[0]
-                    )
-                )
-            elif len(combination) > 1:
-                from_hour = DjangoAvailabilityRepository.get_slot_timing(
-                    day_definition=day_definition,
-                    slot=combination[0]
-                ).from_hour
-                to_hour = DjangoAvailabilityRepository.get_slot_timing(
-                    day_definition=day_definition,
-                    slot=combination[-1]
-                ).to_hour
-                slot_combination_hour_limits.append(
-                    domain.SlotTiming(from_hour=from_hour, to_hour=to_hour)
+            first_slot_timing = slots_timings[
+                combination[0].position % n_positions
+            ]
+            last_slot_timing = slots_timings[
+                combination[-1].position % n_positions
+            ]
+            slot_combination_hour_limits.append(
+                domain.SlotTiming(
+                    from_hour=first_slot_timing.from_hour,
+                    to_hour=last_slot_timing.to_hour
                 )
+            )
         return slot_combination_hour_limits
 
     @staticmethod
     def _get_global_day_availability_type(
-        boats: List[Boat],
-        date_: date
+        boats: Sequence[Boat],
+        date_: date,
+        days_summaries: Dict[Tuple[int, date], domain.DaySummary]
     ) -> str:
         boats_day_availability_types = []
         if date_ < date.today():
             return DayAvailabilityTypes.NO_AVAIL
         for boat in boats:
-            try:
+            day_summary = days_summaries.get((boat.id, date_))
+            if day_summary:
                 boats_day_availability_types.append(
-                    DjangoAvailabilityRepository.get_day(
-                        boat=boat,
-                        date_=date_
-                    ).availability_type
+                    day_summary.availability_type
                 )
-            except (NoDayDefinitionDefined, NoAvailabilityForDay):
+            else:
                 boats_day_availability_types.append(
                     DayAvailabilityTypes.NO_AVAIL
                 )
@@ -354,24 +487,15 @@ class AvailabilityApi:
             )
         return results
 
-    @staticmethod
-    def _apply_discounts(
-        combination: List[domain.Slot],
-        theoretical_price: Decimal,
-        day_definition: domain.DayDefinition,
-        apply_resident_discount: bool,
-    ) -> Decimal:
-        price = theoretical_price
-        if (
-            len(combination) >= day_definition.n_slots_deal_threshold
-            and day_definition.discount_when_deal
-        ):
-            price = theoretical_price - theoretical_price * Decimal(
-                day_definition.discount_when_deal
-            )
-        if apply_resident_discount:
-            price = price - price * Decimal(day_definition.resident_discount)
-        return round(price, 2)
-
 
-api = AvailabilityApi(DjangoAvailabilityRepository, ResponseBuilder)
+api = AvailabilityApi(
+    (
+        DerivedSlotsAvailabilityRepository
+        if settings.AVAILABILITY_DERIVED_SLOTS
+        else DjangoAvailabilityRepository
+    ),
+    ResponseBuilder,
+    ErrorResponseBuilder,
+    StreamResponseBuilder,
+    DjangoDayAvailabilityCache,
+)
@@ -2,14 +2,23 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import List
 
+from django.conf import settings
+from django.db import IntegrityError, connection
+
 from boatsandjoy_api.boats.domain import Boat
-from .exceptions import NoDayDefinitionDefined
+from .caches import DjangoDayAvailabilityCache
+from .domain import Day
+from .exceptions import (
+    AvailabilityAlreadyCreated,
+    DaysWithBookingsNotDeleted,
+    NoDayDefinitionDefined,
+)
 from .repository import DjangoAvailabilityRepository
 
 
 class AvailabilityGeneratorInterface(ABC):
     @abstractmethod
-    def generate(self, year: int = date.today().year) -> List[dict]:
+    def generate(self, year: int = date.today().year) -> List[Day]:
         pass
 
     @abstractmethod
@@ -30,31 +39,92 @@ class AvailabilityGenerator(AvailabilityGeneratorInterface):
                 'This boat has not day definitions defined'
             )
 
-    def generate(self, year: int = date.today().year) -> List[dict]:
+    def generate(self, year: int = date.today().year) -> List[Day]:
+        """
+        Years with any day of the boat already created are not generated,
+        AvailabilityAlreadyCreated is raised instead
+        """
+        if self._exists_availability_for(year):
+            raise self._get_already_created_error(year)
         start_date = date(year, 1, 1)
         end_date = date(year, 12, 31)
-        days = DjangoAvailabilityRepository.create_days(
-            day_definitions=self.day_definitions,
+        try:
+            days = self._create_days(from_=start_date, to=end_date)
+        except IntegrityError:
+            # Created by a concurrent generation after the check
+            raise self._get_already_created_error(year)
+        DjangoAvailabilityRepository.refresh_days_summaries(
+            boat_id=self.boat.id,
             from_=start_date,
             to=end_date
         )
-        return [
-            {
-                'day': day,
-                'slots': DjangoAvailabilityRepository.create_slots(day=day),
-            }
-            for day in days
-        ]
+        DjangoDayAvailabilityCache.invalidate_all()
+        return days
 
     def delete(self, year: int = date.today().year):
-        for day_definition in self.day_definitions:
-            days = list(
-                filter(lambda day: day.date.year == year, day_definition.days)
+        """
+        Days with bookings are not deleted, they are reported raising
+        DaysWithBookingsNotDeleted once the rest of days are deleted
+        """
+        start_date = date(year, 1, 1)
+        end_date = date(year, 12, 31)
+        kept_dates = DjangoAvailabilityRepository.delete_boat_days(
+            boat_id=self.boat.id,
+            from_=start_date,
+            to=end_date
+        )
+        DjangoAvailabilityRepository.refresh_days_summaries(
+            boat_id=self.boat.id,
+            from_=start_date,
+            to=end_date
+        )
+        DjangoDayAvailabilityCache.invalidate_all()
+        if kept_dates:
+            raise DaysWithBookingsNotDeleted(
+                f'Days with bookings were not deleted: '
+                f'{", ".join(str(date_) for date_ in kept_dates)}'
             )
-            DjangoAvailabilityRepository.delete_days(days)
+
+    def _create_days(self, from_: date, to: date) -> List[Day]:
+        return DjangoAvailabilityRepository.create_days(
+            day_definitions=self.day_definitions,
+            from_=from_,
+            to=to
+        )
+
+    def _get_already_created_error(
+        self,
+        year: int
+    ) -> AvailabilityAlreadyCreated:
+        return AvailabilityAlreadyCreated(
+            f'Availability of {self.boat.name} for {year} already created'
+        )
 
     def _exists_availability_for(self, year: int = date.today().year) -> bool:
-        for day_definition in self.day_definitions:
-            if any([day.date.year == year for day in day_definition.days]):
-                return True
-        return False
+        return DjangoAvailabilityRepository.exists_days(
+            boat_id=self.boat.id,
+            year=year
+        )
+
+
+class DatabaseAvailabilityGenerator(AvailabilityGenerator):
+    """
+    Days and slots are generated by PostgreSQL without sending their rows
+    from Python, only available for PostgreSQL databases
+    """
+
+    def _create_days(self, from_: date, to: date) -> List[Day]:
+        return DjangoAvailabilityRepository.create_days_in_database(
+            day_definitions=self.day_definitions,
+            from_=from_,
+            to=to
+        )
+
+
+def get_availability_generator(boat: Boat) -> AvailabilityGeneratorInterface:
+    if (
+        settings.AVAILABILITY_DATABASE_GENERATION
+        and connection.vendor == 'postgresql'
+    ):
+        return DatabaseAvailabilityGenerator(boat)
+    return AvailabilityGenerator(boat)
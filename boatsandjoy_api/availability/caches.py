@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+
+from boatsandjoy_api.core.caches import incr_cache_version
+
+
+class DayAvailabilityCacheInterface(ABC):
+    @classmethod
+    @abstractmethod
+    def get_key(cls, date_: date, apply_resident_discount: bool) -> str:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def get(cls, key: str) -> dict:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def set(cls, key: str, response: dict):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def invalidate(cls, date_: date):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def invalidate_all(cls):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def get_stats(cls) -> dict:
+        pass
+
+
+class DjangoDayAvailabilityCache(DayAvailabilityCacheInterface):
+    """
+    Day availability responses are stored under a key that includes a
+    version of its date and a global version. Slot changes bump the date
+    version while day definitions, price variations and boats changes
+    (which can affect any date) bump the global one, so stale responses
+    are never read again and just expire.
+
+    Versions are only seen by every process with a shared default cache,
+    with a local memory cache changes made by a process don't invalidate
+    the responses cached by the others. Hits and misses are counted by
+    process, without cache round trips
+    """
+
+    PREFIX = 'availability:day'
+    GLOBAL_VERSION_KEY = f'{PREFIX}:version'
+
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get_key(cls, date_: date, apply_resident_discount: bool) -> str:
+        """
+        Key of the response with the current versions. It has to be read
+        before computing the response and used to store it, so a response
+        computed while the versions change is stored under the old key
+        """
+        if not settings.AVAILABILITY_CACHE_TIMEOUT:
+            return None
+        date_version_key = cls._get_date_version_key(date_)
+        versions = cache.get_many([cls.GLOBAL_VERSION_KEY, date_version_key])
+        return (
+            f'{cls.PREFIX}:{date_.isoformat()}:{int(apply_resident_discount)}'
+            f':{versions.get(cls.GLOBAL_VERSION_KEY, 0)}'
+            f':{versions.get(date_version_key, 0)}'
+        )
+
+    @classmethod
+    def get(cls, key: str) -> dict:
+        response = cache.get(key) if key is not None else None
+        if response is None:
+            cls._misses += 1
+        else:
+            cls._hits += 1
+        return response
+
+    @classmethod
+    def set(cls, key: str, response: dict):
+        if key is None:
+            return
+        cache.set(key, response, settings.AVAILABILITY_CACHE_TIMEOUT)
+
+    @classmethod
+    def invalidate(cls, date_: date):
+        incr_cache_version(cls._get_date_version_key(date_))
+
+    @classmethod
+    def invalidate_all(cls):
+        incr_cache_version(cls.GLOBAL_VERSION_KEY)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """
+        Hits and misses of this process
+        """
+        return {'hits': cls._hits, 'misses': cls._misses}
+
+    @classmethod
+    def _get_date_version_key(cls, date_: date) -> str:
+        return f'{cls.PREFIX}:{date_.isoformat()}:version'
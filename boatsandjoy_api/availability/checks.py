@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from boatsandjoy_api.core.utils import is_cache_shared
+
+
+@register(Tags.caches)
+def check_day_availability_cache(app_configs, **kwargs):
+    """
+    Day availability responses cached by a process are only invalidated
+    by the other processes through a shared cache
+    """
+    if (
+        settings.DEBUG
+        or not settings.AVAILABILITY_CACHE_TIMEOUT
+        or is_cache_shared()
+    ):
+        return []
+    return [
+        Warning(
+            'Day availability is cached in a cache local to each process',
+            hint=(
+                'Changes only invalidate the responses cached by the '
+                'process that makes them. When running more than one '
+                'process set CACHE_URL to a cache shared by all of them, '
+                'or AVAILABILITY_CACHE_TIMEOUT to 0 to disable the cache'
+            ),
+            id='availability.W001',
+        )
+    ]
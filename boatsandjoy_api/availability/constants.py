@@ -42,3 +42,39 @@ class DayAvailabilityTypes:
         (PARTIALLY_FREE, 'Partially free'),
         (NO_AVAIL, 'No availability'),
     )
+
+
+class AvailabilityJobActions:
+
+    GENERATE = 'generate'
+    DELETE = 'delete'
+
+    LIST = (
+        (GENERATE, 'Generate'),
+        (DELETE, 'Delete'),
+    )
+
+
+class AvailabilityJobStatus:
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    ERROR = 'error'
+
+    LIST = (
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (ERROR, 'Error'),
+    )
+
+
+# Maximum number of days that can be requested at once for a range
+MAX_RANGE_AVAILABILITY_DAYS = 31
+
+# Days store their slots positions as bits of a signed 64 bits integer
+MAX_SLOTS_PER_DAY = 63
+
+# Rows inserted by each query of availability bulk inserts
+BULK_CREATE_BATCH_SIZE = 1000
@@ -2,7 +2,7 @@ from collections import namedtuple
 from dataclasses import dataclass
 from datetime import date, time
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from .constants import DayAvailabilityTypes
 
@@ -17,23 +17,48 @@ class Slot:
     day_id: int
 
 
+@dataclass
+class SlotsCount:
+    total: int
+    booked: int
+
+    @classmethod
+    def from_masks(cls, slots_mask: int, booked_slots_mask: int):
+        return cls(
+            total=bin(slots_mask).count('1'),
+            booked=bin(booked_slots_mask & slots_mask).count('1'),
+        )
+
+    @property
+    def availability_type(self):
+        if self.booked == self.total:
+            return DayAvailabilityTypes.FULL
+        elif self.booked > 0:
+            return DayAvailabilityTypes.PARTIALLY_FREE
+        else:
+            return DayAvailabilityTypes.FREE
+
+
 @dataclass
 class Day:
     id: int
     date: date
     day_definition_id: int
     slots: List[Slot]
+    slots_mask: int = 0
+    booked_slots_mask: int = 0
+
+    @property
+    def slots_count(self) -> SlotsCount:
+        return SlotsCount.from_masks(self.slots_mask, self.booked_slots_mask)
+
+    @property
+    def free_slots_mask(self) -> int:
+        return self.slots_mask & ~self.booked_slots_mask
 
     @property
     def availability_type(self):
-        n_booked_slots = len(list(filter(lambda slot: slot.booked, self.slots)))
-        n_total_slots = len(self.slots)
-        if n_booked_slots == n_total_slots:
-            return DayAvailabilityTypes.FULL
-        elif n_booked_slots > 0:
-            return DayAvailabilityTypes.PARTIALLY_FREE
-        else:
-            return DayAvailabilityTypes.FREE
+        return self.slots_count.availability_type
 
 
 @dataclass
@@ -46,7 +71,6 @@ class DayDefinition:
     from_date: date
     to_date: date
     boat_id: int
-    days: List[Day]
     n_slots_deal_threshold: int
     discount_when_deal: float
     resident_discount: float
@@ -60,5 +84,26 @@ class PriceVariation:
     boat_id: int
 
 
+@dataclass
+class DaySummary:
+    boat_id: int
+    date: date
+    total_slots: int
+    booked_slots: int
+    availability_type: str
+
+
+@dataclass
+class BoatDay:
+    """
+    Everything needed to compute the availability of a boat in a single date
+    """
+
+    boat_id: int
+    day_definition: DayDefinition
+    day: Day
+    price_variation: Optional[PriceVariation]
+
+
 SlotTiming = namedtuple('SlotTiming', ['from_hour', 'to_hour'])
 DateRange = namedtuple('DateRange', ['from_date', 'to_date'])
@@ -27,3 +27,11 @@ class NoSlotsAvailable(AvailabilityApiException):
 
 class AvailabilityAlreadyCreated(AvailabilityApiException):
     pass
+
+
+class DaysWithBookingsNotDeleted(AvailabilityApiException):
+    pass
+
+
+class SlotsAlreadyBooked(AvailabilityApiException):
+    pass
@@ -0,0 +1,91 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional
+
+from boatsandjoy_api.core.caches import VersionedSnapshot
+from . import domain, models
+
+
+class DateIntervalIndex:
+    """
+    Sorted non overlapping date intervals (objects with from_date and
+    to_date) where the interval that covers a date is found with bisect
+    """
+
+    def __init__(self, intervals: list):
+        self.intervals = sorted(intervals, key=lambda obj: obj.from_date)
+        self.from_dates = [interval.from_date for interval in self.intervals]
+
+    def find(self, date_: date):
+        i = bisect_right(self.from_dates, date_) - 1
+        if i >= 0 and self.intervals[i].to_date >= date_:
+            return self.intervals[i]
+        return None
+
+
+class BoatsIntervalIndexes:
+    def __init__(
+        self,
+        day_definitions: Dict[int, List[domain.DayDefinition]],
+        price_variations: Dict[int, List[domain.PriceVariation]],
+    ):
+        self.day_definitions = {
+            boat_id: DateIntervalIndex(intervals)
+            for boat_id, intervals in day_definitions.items()
+        }
+        self.price_variations = {
+            boat_id: DateIntervalIndex(intervals)
+            for boat_id, intervals in price_variations.items()
+        }
+
+    def get_day_definition(
+        self,
+        boat_id: int,
+        date_: date
+    ) -> Optional[domain.DayDefinition]:
+        index = self.day_definitions.get(boat_id)
+        return index.find(date_) if index else None
+
+    def get_price_variation(
+        self,
+        boat_id: int,
+        date_: date
+    ) -> Optional[domain.PriceVariation]:
+        index = self.price_variations.get(boat_id)
+        return index.find(date_) if index else None
+
+
+class DjangoBoatsIntervalIndexes(VersionedSnapshot):
+    """
+    Process local indexes of day definitions and price variations by boat,
+    day definitions and price variations changes bump their version
+    """
+
+    VERSION_KEY = 'availability:intervals:version'
+    TIMEOUT_SETTING = 'AVAILABILITY_INDEXES_TIMEOUT'
+
+    @classmethod
+    def get(cls) -> BoatsIntervalIndexes:
+        return super().get()
+
+    @classmethod
+    def _load(cls) -> BoatsIntervalIndexes:
+        # Imported here to avoid a circular import with the repository
+        from .repository import DjangoAvailabilityRepository
+
+        day_definitions = defaultdict(list)
+        for day_definition in models.DayDefinition.objects.all():
+            day_definitions[day_definition.boat_id].append(
+                DjangoAvailabilityRepository.get_day_definition_domain_object(
+                    day_definition
+                )
+            )
+        price_variations = defaultdict(list)
+        for price_variation in models.PriceVariation.objects.all():
+            price_variations[price_variation.boat_id].append(
+                DjangoAvailabilityRepository.get_price_variation_domain_object(
+                    price_variation
+                )
+            )
+        return BoatsIntervalIndexes(day_definitions, price_variations)
@@ -0,0 +1,94 @@
+import traceback
+from datetime import timedelta
+from typing import List, Optional
+
+from django.utils import timezone
+
+from boatsandjoy_api.core.exceptions import BoatsAndJoyException
+from . import models
+from .availability_generators import get_availability_generator
+from .constants import AvailabilityJobActions, AvailabilityJobStatus
+
+
+class AvailabilityJobsQueue:
+    """
+    Database backed queue of availability jobs. Jobs are claimed with a
+    conditional update of their status, so any number of workers can
+    share the queue without locks
+    """
+
+    @classmethod
+    def enqueue(cls, boat_ids: List[int], action: str, year: int):
+        models.AvailabilityJob.objects.bulk_create(
+            [
+                models.AvailabilityJob(
+                    boat_id=boat_id,
+                    action=action,
+                    year=year
+                )
+                for boat_id in boat_ids
+            ]
+        )
+
+    @classmethod
+    def claim(cls) -> Optional[models.AvailabilityJob]:
+        """
+        :return: the oldest pending job, already marked as running, or None
+            when there are no pending jobs
+        """
+        pending_jobs = models.AvailabilityJob.objects.filter(
+            status=AvailabilityJobStatus.PENDING
+        )
+        while True:
+            job = pending_jobs.order_by('created', 'id').first()
+            if job is None:
+                return None
+            job.status = AvailabilityJobStatus.RUNNING
+            job.started = job.modified = timezone.now()
+            claimed = pending_jobs.filter(id=job.id).update(
+                status=job.status,
+                started=job.started,
+                modified=job.modified,
+            )
+            if claimed:
+                return job
+
+    @classmethod
+    def requeue_stale(cls, running_for: timedelta) -> int:
+        """
+        Jobs left running by workers that died are marked as pending again
+        once they have been running for longer than the given time
+
+        :return: number of requeued jobs
+        """
+        return models.AvailabilityJob.objects.filter(
+            status=AvailabilityJobStatus.RUNNING,
+            started__lt=timezone.now() - running_for,
+        ).update(
+            status=AvailabilityJobStatus.PENDING,
+            started=None,
+            modified=timezone.now(),
+        )
+
+    @classmethod
+    def run(cls, job: models.AvailabilityJob):
+        """
+        Runs the job and stores its result, errors are stored in the job
+        to be reported in the admin instead of being raised
+        """
+        try:
+            availability_generator = get_availability_generator(job.boat)
+            if job.action == AvailabilityJobActions.GENERATE:
+                availability_generator.generate(job.year)
+            else:
+                availability_generator.delete(job.year)
+        except BoatsAndJoyException as e:
+            job.status = AvailabilityJobStatus.ERROR
+            job.error = str(e)
+        except Exception:
+            job.status = AvailabilityJobStatus.ERROR
+            job.error = traceback.format_exc()
+        else:
+            job.status = AvailabilityJobStatus.DONE
+        job.finished = timezone.now()
+        job.save(update_fields=['status', 'error', 'finished', 'modified'])
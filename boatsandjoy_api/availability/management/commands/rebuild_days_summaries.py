@@ -0,0 +1,34 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from boatsandjoy_api.availability.repository import (
+    DjangoAvailabilityRepository,
+)
+from boatsandjoy_api.boats.models import Boat
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds days summaries from current days and slots'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--boat', type=int, help='Boat id to rebuild')
+        parser.add_argument('--year', type=int, help='Year to rebuild')
+
+    def handle(self, *args, **options):
+        boats = Boat.objects.all()
+        if options['boat']:
+            boats = boats.filter(id=options['boat'])
+        if options['year']:
+            from_ = date(options['year'], 1, 1)
+            to = date(options['year'], 12, 31)
+        else:
+            from_ = date.min
+            to = date.max
+        for boat in boats:
+            DjangoAvailabilityRepository.refresh_days_summaries(
+                boat_id=boat.id,
+                from_=from_,
+                to=to
+            )
+            self.stdout.write(f'Days summaries of boat {boat} rebuilt')
@@ -0,0 +1,87 @@
+import sys
+import time
+from datetime import timedelta
+from multiprocessing import Process
+
+import django
+from django.core.management.base import BaseCommand, OutputWrapper
+from django.db import connections
+
+from boatsandjoy_api.availability.jobs import AvailabilityJobsQueue
+
+
+class Command(BaseCommand):
+    help = 'Runs queued availability jobs in parallel worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5,
+            help='Seconds to wait for new jobs when the queue is empty'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when the queue is empty'
+        )
+        parser.add_argument(
+            '--stale-after',
+            type=float,
+            default=1800,
+            help=(
+                'Seconds after which running jobs are considered abandoned '
+                'by a dead worker and queued again'
+            )
+        )
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(seconds=options['stale_after'])
+        requeue_stale_jobs(stale_after)
+        if options['workers'] == 1:
+            work(options['poll_interval'], options['once'], stale_after)
+            return
+        # Every process has to open its own database connections
+        connections.close_all()
+        workers = [
+            Process(
+                target=work,
+                args=(options['poll_interval'], options['once'], stale_after)
+            )
+            for _ in range(options['workers'])
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+
+def work(poll_interval: float, once: bool, stale_after: timedelta):
+    # Processes started with spawn don't inherit the loaded apps
+    django.setup()
+    stdout = OutputWrapper(sys.stdout)
+    while True:
+        job = AvailabilityJobsQueue.claim()
+        if job is None:
+            if once:
+                return
+            # Jobs of workers that died while this one keeps running
+            requeue_stale_jobs(stale_after)
+            time.sleep(poll_interval)
+            continue
+        AvailabilityJobsQueue.run(job)
+        stdout.write(f'Job {job.id} {job}')
+
+
+def requeue_stale_jobs(stale_after: timedelta):
+    requeued_jobs = AvailabilityJobsQueue.requeue_stale(stale_after)
+    if requeued_jobs:
+        OutputWrapper(sys.stdout).write(
+            f'{requeued_jobs} stale running jobs requeued'
+        )
@@ -0,0 +1,60 @@
+# Generated by Django 3.1.5 on 2026-10-17 12:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boats', '0001_initial'),
+        ('availability', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DaySummary',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('date', models.DateField()),
+                ('total_slots', models.IntegerField(default=0)),
+                ('booked_slots', models.IntegerField(default=0)),
+                (
+                    'availability_type',
+                    models.CharField(
+                        choices=[
+                            ('free', 'Free'),
+                            ('full', 'Full'),
+                            ('partially_free', 'Partially free'),
+                            ('no_availability', 'No availability'),
+                        ],
+                        default='no_availability',
+                        max_length=20,
+                    ),
+                ),
+                (
+                    'boat',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='days_summaries',
+                        to='boats.boat',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'day summary',
+                'verbose_name_plural': 'days summaries',
+                'unique_together': {('boat', 'date')},
+            },
+        ),
+    ]
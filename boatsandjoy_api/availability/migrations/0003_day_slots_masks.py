@@ -0,0 +1,62 @@
+# Generated by Django 3.1.5 on 2026-10-17 12:37
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def fill_days_slots_masks(apps, schema_editor):
+    Day = apps.get_model('availability', 'Day')
+    Slot = apps.get_model('availability', 'Slot')
+    days_masks = {}
+    for day_id, position, booked in Slot.objects.values_list(
+        'day_id', 'position', 'booked'
+    ).iterator():
+        slots_mask, booked_slots_mask = days_masks.get(day_id, (0, 0))
+        slots_mask |= 1 << position
+        if booked:
+            booked_slots_mask |= 1 << position
+        days_masks[day_id] = (slots_mask, booked_slots_mask)
+    for day_id, (slots_mask, booked_slots_mask) in days_masks.items():
+        Day.objects.filter(id=day_id).update(
+            slots_mask=slots_mask,
+            booked_slots_mask=booked_slots_mask,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0002_day_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='day',
+            name='booked_slots_mask',
+            field=models.BigIntegerField(
+                default=0,
+                help_text='Bit n is set when the slot at position n is booked',
+            ),
+        ),
+        migrations.AddField(
+            model_name='day',
+            name='slots_mask',
+            field=models.BigIntegerField(
+                default=0,
+                help_text='Bit n is set when the day has a slot at position n',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='daydefinition',
+            name='n_slots',
+            field=models.IntegerField(
+                default=0,
+                help_text='Number of availability slots in a single day',
+                validators=[django.core.validators.MaxValueValidator(63)],
+            ),
+        ),
+        migrations.RunPython(
+            fill_days_slots_masks,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 3.1.5 on 2026-10-17 12:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boats', '0001_initial'),
+        ('availability', '0003_day_slots_masks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvailabilityJob',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+                (
+                    'action',
+                    models.CharField(
+                        choices=[
+                            ('generate', 'Generate'),
+                            ('delete', 'Delete'),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ('year', models.IntegerField()),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('pending', 'Pending'),
+                            ('running', 'Running'),
+                            ('done', 'Done'),
+                            ('error', 'Error'),
+                        ],
+                        default='pending',
+                        max_length=10,
+                    ),
+                ),
+                ('error', models.TextField(blank=True, default='')),
+                ('started', models.DateTimeField(blank=True, null=True)),
+                ('finished', models.DateTimeField(blank=True, null=True)),
+                (
+                    'boat',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='availability_jobs',
+                        to='boats.boat',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'availability job',
+                'verbose_name_plural': 'availability jobs',
+                'index_together': {('status', 'created')},
+            },
+        ),
+    ]
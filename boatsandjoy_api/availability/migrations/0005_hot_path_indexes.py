@@ -0,0 +1,119 @@
+# Generated by Django 3.1.5 on 2026-10-17 13:01
+
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def remove_duplicated_days_and_slots(apps, schema_editor):
+    """
+    Generating a year twice created duplicated days (and slots) before
+    they were unique. The duplicates referenced by bookings (or booked)
+    are kept and the rest deleted, when more than one duplicate is
+    referenced by bookings they are listed and the migration fails
+    """
+    Day = apps.get_model('availability', 'Day')
+    Slot = apps.get_model('availability', 'Slot')
+    BookingSlot = apps.get_model('bookings', 'Booking').slots.through
+    booking_slot_ids = set(
+        BookingSlot.objects.values_list('slot_id', flat=True)
+    )
+    conflicts = []
+
+    def get_duplicates(model, fields):
+        duplicated_values = (
+            model.objects.order_by()
+            .values(*fields)
+            .annotate(count=Count('id'))
+            .filter(count__gt=1)
+        )
+        groups = defaultdict(list)
+        for values in duplicated_values:
+            values.pop('count')
+            for obj in model.objects.filter(**values).order_by('id'):
+                groups[tuple(values.values())].append(obj)
+        return groups
+
+    def get_ids_to_delete(objs, has_bookings, is_booked, description):
+        with_bookings = [obj for obj in objs if has_bookings(obj)]
+        if len(with_bookings) > 1:
+            conflicts.append(
+                f'{description} with ids '
+                f'{", ".join(str(obj.id) for obj in with_bookings)}'
+            )
+            return set()
+        booked = [obj for obj in objs if is_booked(obj)]
+        kept = with_bookings[0] if with_bookings else (booked or objs)[0]
+        return {obj.id for obj in objs if obj.id != kept.id}
+
+    day_ids_to_delete = set()
+    duplicated_days = get_duplicates(Day, ('definition_id', 'date'))
+    for (definition_id, date_), days in duplicated_days.items():
+        days_slots = {
+            day.id: list(Slot.objects.filter(day_id=day.id)) for day in days
+        }
+        day_ids_to_delete |= get_ids_to_delete(
+            days,
+            lambda day: any(
+                slot.id in booking_slot_ids for slot in days_slots[day.id]
+            ),
+            lambda day: any(slot.booked for slot in days_slots[day.id]),
+            f'Days of day definition {definition_id} on {date_}',
+        )
+
+    slot_ids_to_delete = set()
+    duplicated_slots = get_duplicates(Slot, ('day_id', 'position'))
+    for (day_id, position), slots in duplicated_slots.items():
+        if day_id in day_ids_to_delete:
+            continue
+        slot_ids_to_delete |= get_ids_to_delete(
+            slots,
+            lambda slot: slot.id in booking_slot_ids,
+            lambda slot: slot.booked,
+            f'Slots of day {day_id} in position {position}',
+        )
+
+    if conflicts:
+        raise ValueError(
+            'Bookings of these duplicated days or slots have to be moved '
+            'to one of them by hand before migrating:\n' + '\n'.join(conflicts)
+        )
+    Slot.objects.filter(id__in=slot_ids_to_delete).delete()
+    Day.objects.filter(id__in=day_ids_to_delete).delete()
+    if schema_editor.connection.vendor == 'postgresql':
+        # Deleted rows leave deferred foreign key checks pending, which
+        # don't let PostgreSQL alter the tables in the same transaction
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boats', '0001_initial'),
+        ('availability', '0004_availability_job'),
+        ('bookings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicated_days_and_slots,
+            migrations.RunPython.noop,
+        ),
+        migrations.AlterUniqueTogether(
+            name='day',
+            unique_together={('definition', 'date')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='slot',
+            unique_together={('day', 'position')},
+        ),
+        migrations.AlterIndexTogether(
+            name='daydefinition',
+            index_together={('boat', 'from_date', 'to_date')},
+        ),
+        migrations.AlterIndexTogether(
+            name='pricevariation',
+            index_together={('boat', 'from_date', 'to_date')},
+        ),
+    ]
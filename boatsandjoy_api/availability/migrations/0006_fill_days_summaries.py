@@ -0,0 +1,51 @@
+from django.db import migrations
+
+from boatsandjoy_api.availability.constants import DayAvailabilityTypes
+
+
+def fill_days_summaries(apps, schema_editor):
+    Day = apps.get_model('availability', 'Day')
+    DaySummary = apps.get_model('availability', 'DaySummary')
+    days = Day.objects.values_list(
+        'definition__boat_id', 'date', 'slots_mask', 'booked_slots_mask'
+    )
+    slots_counts = {}
+    for boat_id, date_, slots_mask, booked_slots_mask in days.iterator():
+        total, booked = slots_counts.get((boat_id, date_), (0, 0))
+        total += bin(slots_mask).count('1')
+        booked += bin(booked_slots_mask & slots_mask).count('1')
+        slots_counts[(boat_id, date_)] = (total, booked)
+
+    days_summaries = []
+    for (boat_id, date_), (total, booked) in slots_counts.items():
+        if booked == total:
+            availability_type = DayAvailabilityTypes.FULL
+        elif booked > 0:
+            availability_type = DayAvailabilityTypes.PARTIALLY_FREE
+        else:
+            availability_type = DayAvailabilityTypes.FREE
+        days_summaries.append(
+            DaySummary(
+                boat_id=boat_id,
+                date=date_,
+                total_slots=total,
+                booked_slots=booked,
+                availability_type=availability_type,
+            )
+        )
+    DaySummary.objects.all().delete()
+    DaySummary.objects.bulk_create(days_summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0005_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            fill_days_summaries,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -5,6 +5,12 @@ from django.db import models
 
 from boatsandjoy_api.boats.models import Boat
 from boatsandjoy_api.core.models import BaseModel
+from .constants import (
+    AvailabilityJobActions,
+    AvailabilityJobStatus,
+    DayAvailabilityTypes,
+    MAX_SLOTS_PER_DAY,
+)
 
 
 class DayDefinition(BaseModel):
@@ -29,6 +35,7 @@ class DayDefinition(BaseModel):
     )
     n_slots = models.IntegerField(
         default=0,
+        validators=[MaxValueValidator(MAX_SLOTS_PER_DAY)],
         help_text='Number of availability slots in a single day'
     )
     price_per_hour = models.DecimalField(
@@ -77,6 +84,7 @@ class DayDefinition(BaseModel):
     class Meta:
         verbose_name = 'day definition'
         verbose_name_plural = 'day definition'
+        index_together = ('boat', 'from_date', 'to_date')
 
 
 class Day(BaseModel):
@@ -86,6 +94,14 @@ class Day(BaseModel):
         on_delete=models.CASCADE
     )
     date = models.DateField()
+    slots_mask = models.BigIntegerField(
+        default=0,
+        help_text='Bit n is set when the day has a slot at position n'
+    )
+    booked_slots_mask = models.BigIntegerField(
+        default=0,
+        help_text='Bit n is set when the slot at position n is booked'
+    )
 
     def __str__(self) -> str:
         return str(self.date)
@@ -98,6 +114,7 @@ class Day(BaseModel):
         verbose_name = 'day'
         verbose_name_plural = 'days'
         ordering = ('date',)
+        unique_together = ('definition', 'date')
 
 
 class Slot(BaseModel):
@@ -125,6 +142,7 @@ class Slot(BaseModel):
         verbose_name = 'slot'
         verbose_name_plural = 'slots'
         ordering = ('position',)
+        unique_together = ('day', 'position')
 
 
 class PriceVariation(BaseModel):
@@ -154,3 +172,67 @@ class PriceVariation(BaseModel):
     class Meta:
         verbose_name = 'price variation'
         verbose_name_plural = 'price variations'
+        index_together = ('boat', 'from_date', 'to_date')
+
+
+class DaySummary(BaseModel):
+    """
+    Denormalized availability of a boat in a single date. It has to be
+    refreshed every time that days or slots of the boat are modified
+    """
+
+    boat = models.ForeignKey(
+        Boat,
+        related_name='days_summaries',
+        on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    total_slots = models.IntegerField(default=0)
+    booked_slots = models.IntegerField(default=0)
+    availability_type = models.CharField(
+        choices=DayAvailabilityTypes.LIST,
+        default=DayAvailabilityTypes.NO_AVAIL,
+        max_length=20,
+    )
+
+    def __str__(self) -> str:
+        return f'{self.boat} {self.date} {self.availability_type}'
+
+    class Meta:
+        verbose_name = 'day summary'
+        verbose_name_plural = 'days summaries'
+        unique_together = ('boat', 'date')
+
+
+class AvailabilityJob(BaseModel):
+    """
+    Generation or deletion of the availability of a boat in a year queued
+    to be run by run_availability_jobs workers out of the admin requests
+    """
+
+    boat = models.ForeignKey(
+        Boat,
+        related_name='availability_jobs',
+        on_delete=models.CASCADE
+    )
+    action = models.CharField(
+        choices=AvailabilityJobActions.LIST,
+        max_length=10
+    )
+    year = models.IntegerField()
+    status = models.CharField(
+        choices=AvailabilityJobStatus.LIST,
+        default=AvailabilityJobStatus.PENDING,
+        max_length=10,
+    )
+    error = models.TextField(default='', blank=True)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f'{self.action} {self.boat} {self.year} ({self.status})'
+
+    class Meta:
+        verbose_name = 'availability job'
+        verbose_name_plural = 'availability jobs'
+        index_together = ('status', 'created')
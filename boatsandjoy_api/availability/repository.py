@@ -1,12 +1,87 @@
 from abc import ABC, abstractmethod
-from datetime import date, datetime, timedelta
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import List
+from functools import partial
+from itertools import chain
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.db import connection, transaction
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
 
-from boatsandjoy_api.boats.domain import Boat
 from boatsandjoy_api.core.data_adapters import DjangoDataAdapter
 from . import domain, models
-from .exceptions import NoAvailabilityForDay, NoDayDefinitionDefined
+from .caches import DjangoDayAvailabilityCache
+from .constants import BULK_CREATE_BATCH_SIZE
+from .exceptions import NoDayDefinitionDefined, SlotsAlreadyBooked
+from .indexes import DjangoBoatsIntervalIndexes
+from .utils import daterange, get_slots_timings
+
+# Days of the dates in [from_, to) covered by the day definitions (the first
+# one of the list when they overlap) and their slots. Slots hours wrap
+# around midnight as time + interval does
+CREATE_DAYS_IN_DATABASE_SQL = """
+WITH new_days AS (
+    INSERT INTO {day_table} (
+        created, modified, definition_id, date, slots_mask, booked_slots_mask
+    )
+    SELECT DISTINCT ON (dates.date)
+        now(),
+        now(),
+        definition.id,
+        dates.date::date,
+        ~((-1)::bigint << definition.n_slots),
+        0
+    FROM {day_definition_table} AS definition
+    CROSS JOIN LATERAL generate_series(
+        GREATEST(definition.from_date, %(from_)s::date)::timestamp,
+        LEAST(definition.to_date, %(to)s::date - 1)::timestamp,
+        interval '1 day'
+    ) AS dates(date)
+    WHERE definition.id = ANY(%(day_definitions_ids)s::integer[])
+    ORDER BY
+        dates.date,
+        array_position(%(day_definitions_ids)s::integer[], definition.id)
+    RETURNING id, date, definition_id, slots_mask
+),
+new_slots AS (
+    INSERT INTO {slot_table} (
+        created, modified, day_id, position, from_hour, to_hour, booked
+    )
+    SELECT
+        now(),
+        now(),
+        new_days.id,
+        positions.position,
+        definition.first_time
+            + make_interval(hours => definition.hours_per_slot
+            * positions.position),
+        definition.first_time
+            + make_interval(hours => definition.hours_per_slot
+            * (positions.position + 1)),
+        false
+    FROM new_days
+    JOIN {day_definition_table} AS definition
+        ON definition.id = new_days.definition_id
+    CROSS JOIN LATERAL generate_series(
+        0, definition.n_slots - 1
+    ) AS positions(position)
+    RETURNING id, day_id, position, from_hour, to_hour
+)
+SELECT
+    new_days.id,
+    new_days.date,
+    new_days.definition_id,
+    new_days.slots_mask,
+    new_slots.id,
+    new_slots.position,
+    new_slots.from_hour,
+    new_slots.to_hour
+FROM new_days
+LEFT JOIN new_slots ON new_slots.day_id = new_days.id
+ORDER BY new_days.date, new_slots.position
+"""
 
 
 class AvailabilityRepository(ABC):
@@ -33,7 +108,12 @@ class AvailabilityRepository(ABC):
 
     @classmethod
     @abstractmethod
-    def create_slots(cls, day: domain.Day) -> List[domain.Slot]:
+    def set_slots_booked(cls, slot_ids: List[int], booked: bool):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def claim_slots(cls, slot_ids: List[int]):
         pass
 
     @classmethod
@@ -45,28 +125,48 @@ class AvailabilityRepository(ABC):
 
     @classmethod
     @abstractmethod
-    def delete_days(cls, days: List[domain.Day]):
+    def exists_days(cls, boat_id: int = None, year: int = None) -> bool:
         pass
 
     @classmethod
     @abstractmethod
-    def get_day(cls, boat: Boat, date_: date) -> domain.Day:
+    def delete_boat_days(
+        cls, boat_id: int, from_: date, to: date
+    ) -> List[date]:
         pass
 
     @classmethod
-    def get_slot_timing(
-        cls,
-        day_definition: domain.DayDefinition,
-        slot: domain.Slot
-    ) -> domain.SlotTiming:
-        hours_per_slot = day_definition.hours_per_slot
-        delta = timedelta(hours=hours_per_slot * slot.position)
-        from_hour = (
-            datetime.combine(date(1, 1, 1), day_definition.first_time) + delta
-        ).time()
-        delta2 = timedelta(hours=day_definition.hours_per_slot)
-        to_hour = (datetime.combine(date(1, 1, 1), from_hour) + delta2).time()
-        return domain.SlotTiming(from_hour=from_hour, to_hour=to_hour)
+    @abstractmethod
+    def get_boats_days(
+        cls, boat_ids: List[int], date_: date
+    ) -> Dict[int, domain.BoatDay]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def filter_boats_days(
+        cls, boat_ids: List[int], from_: date, to: date
+    ) -> Dict[date, Dict[int, domain.BoatDay]]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def count_slots(
+        cls, boat_ids: List[int], from_: date, to: date
+    ) -> Dict[Tuple[int, date], domain.SlotsCount]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def filter_days_summaries(
+        cls, boat_ids: List[int], from_: date, to: date
+    ) -> Dict[Tuple[int, date], domain.DaySummary]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def refresh_days_summaries(cls, boat_id: int, from_: date, to: date):
+        pass
 
     @classmethod
     def get_available_slots(cls, day: domain.Day) -> List[domain.Slot]:
@@ -77,19 +177,16 @@ class AvailabilityRepository(ABC):
         return sorted(slots, key=lambda slot: slot.position)
 
     @classmethod
-    def get_price_per_hour(cls, boat: Boat, date_: date) -> Decimal:
-        day_definition = cls.get_day_definition(boat_id=boat.id, date_=date_)
-        price_variations = cls.filter_price_variations(
-            boat_id=boat.id,
-            date_=date_
-        )
+    def calculate_price_per_hour(
+        cls,
+        day_definition: domain.DayDefinition,
+        price_variation: domain.PriceVariation = None,
+    ) -> Decimal:
         price = day_definition.price_per_hour
-        if price_variations:
-            price_variation = price_variations[0]
-            if price_variation.factor:
-                price = day_definition.price_per_hour * Decimal(
-                    price_variation.factor
-                )
+        if price_variation and price_variation.factor:
+            price = day_definition.price_per_hour * Decimal(
+                price_variation.factor
+            )
         return round(price, 2)
 
 
@@ -121,6 +218,18 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
         boat_id: int = None,
         date_: date = None
     ) -> domain.DayDefinition:
+        if obj_id is None and boat_id is not None and date_ is not None:
+            intervals_indexes = DjangoBoatsIntervalIndexes.get()
+            day_definition = intervals_indexes.get_day_definition(
+                boat_id=boat_id,
+                date_=date_
+            )
+            if not day_definition:
+                raise NoDayDefinitionDefined(
+                    f'This boat has not a day definition for day {date_}'
+                )
+            return day_definition
+
         django_filters = cls.DATA_ADAPTER.transform(
             id=obj_id,
             boat_id=boat_id,
@@ -142,30 +251,223 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
         from_: date,
         to: date
     ) -> List[domain.Day]:
+        """
+        Creates the days (and all their slots) of the dates between both
+        dates covered by the day definitions with a few bulk inserts in
+        the same transaction. Ids of the created slots are only set when
+        the database returns them from bulk inserts
+        """
         days = []
         for i in range(int((to - from_).days)):
             date_ = from_ + timedelta(days=i)
             for day_definition in day_definitions:
                 if day_definition.from_date <= date_ <= day_definition.to_date:
                     days.append(
-                        models.Day(definition_id=day_definition.id, date=date_)
+                        models.Day(
+                            definition_id=day_definition.id,
+                            date=date_,
+                            slots_mask=(1 << day_definition.n_slots) - 1,
+                        )
                     )
                     break
-        days = models.Day.objects.bulk_create(days)
-        return [cls.get_day_domain_object(day) for day in days]
+        day_definitions_by_id = {
+            day_definition.id: day_definition
+            for day_definition in day_definitions
+        }
+        with transaction.atomic():
+            if not connection.features.can_return_rows_from_bulk_insert:
+                existing_days_ids = set(
+                    cls._filter_created_days(day_definitions, from_, to)
+                    .values_list('id', flat=True)
+                )
+            models.Day.objects.bulk_create(
+                days,
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+            if not connection.features.can_return_rows_from_bulk_insert:
+                days_ids = {
+                    (definition_id, date_): day_id
+                    for day_id, definition_id, date_ in (
+                        cls._filter_created_days(day_definitions, from_, to)
+                        .values_list('id', 'definition_id', 'date')
+                    )
+                    if day_id not in existing_days_ids
+                }
+                for day in days:
+                    day.id = days_ids[(day.definition_id, day.date)]
+            days_slots = []
+            for day in days:
+                day_definition = day_definitions_by_id[day.definition_id]
+                slots_timings = get_slots_timings(
+                    first_time=day_definition.first_time,
+                    hours_per_slot=day_definition.hours_per_slot
+                )
+                slots = []
+                for position in range(day_definition.n_slots):
+                    slot_timing = slots_timings[position % len(slots_timings)]
+                    slots.append(
+                        models.Slot(
+                            day_id=day.id,
+                            position=position,
+                            from_hour=slot_timing.from_hour,
+                            to_hour=slot_timing.to_hour,
+                        )
+                    )
+                days_slots.append(slots)
+            models.Slot.objects.bulk_create(
+                chain.from_iterable(days_slots),
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+        return [
+            domain.Day(
+                id=day.id,
+                date=day.date,
+                day_definition_id=day.definition_id,
+                slots=[cls.get_slot_domain_object(slot) for slot in slots],
+                slots_mask=day.slots_mask,
+                booked_slots_mask=day.booked_slots_mask,
+            )
+            for day, slots in zip(days, days_slots)
+        ]
 
     @classmethod
-    def create_slots(cls, day: domain.Day) -> List[domain.Slot]:
-        day_definition = cls.get_day_definition(obj_id=day.day_definition_id)
-        slots = []
-        for i in range(day_definition.n_slots):
-            slot = models.Slot(day_id=day.id, position=i)
-            slot_timing = cls.get_slot_timing(day_definition, slot)
-            slot.from_hour = slot_timing.from_hour
-            slot.to_hour = slot_timing.to_hour
-            slots.append(slot)
-        slots = models.Slot.objects.bulk_create(slots)
-        return [cls.get_slot_domain_object(slot) for slot in slots]
+    def create_days_in_database(
+        cls,
+        day_definitions: List[domain.DayDefinition],
+        from_: date,
+        to: date
+    ) -> List[domain.Day]:
+        """
+        Same days and slots than create_days, but dates, positions, masks
+        and slots timings are generated by PostgreSQL (generate_series) in
+        a single INSERT ... SELECT statement, rows are not sent from Python
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                CREATE_DAYS_IN_DATABASE_SQL.format(
+                    day_table=models.Day._meta.db_table,
+                    slot_table=models.Slot._meta.db_table,
+                    day_definition_table=models.DayDefinition._meta.db_table,
+                ),
+                {
+                    'day_definitions_ids': [
+                        day_definition.id for day_definition in day_definitions
+                    ],
+                    'from_': from_,
+                    'to': to,
+                },
+            )
+            rows = cursor.fetchall()
+        days = {}
+        for (
+            day_id,
+            date_,
+            day_definition_id,
+            slots_mask,
+            slot_id,
+            position,
+            from_hour,
+            to_hour,
+        ) in rows:
+            if day_id not in days:
+                days[day_id] = domain.Day(
+                    id=day_id,
+                    date=date_,
+                    day_definition_id=day_definition_id,
+                    slots=[],
+                    slots_mask=slots_mask,
+                )
+            if slot_id is None:
+                # Day without slots
+                continue
+            days[day_id].slots.append(
+                domain.Slot(
+                    id=slot_id,
+                    position=position,
+                    from_hour=from_hour,
+                    to_hour=to_hour,
+                    booked=False,
+                    day_id=day_id,
+                )
+            )
+        return list(days.values())
+
+    @staticmethod
+    def _filter_created_days(
+        day_definitions: List[domain.DayDefinition],
+        from_: date,
+        to: date
+    ) -> QuerySet:
+        return models.Day.objects.filter(
+            definition_id__in=[
+                day_definition.id for day_definition in day_definitions
+            ],
+            date__gte=from_,
+            date__lt=to,
+        )
+
+    @classmethod
+    def set_slots_booked(cls, slot_ids: List[int], booked: bool):
+        """
+        Updates booked flag of the slots and booked slots masks of
+        their days in the same transaction
+        """
+        with transaction.atomic():
+            models.Slot.objects.filter(id__in=slot_ids).update(
+                booked=booked,
+                modified=timezone.now()
+            )
+            dates = cls._update_booked_slots_masks(slot_ids, booked=booked)
+        for date_ in dates:
+            transaction.on_commit(
+                partial(DjangoDayAvailabilityCache.invalidate, date_)
+            )
+
+    @classmethod
+    def claim_slots(cls, slot_ids: List[int]):
+        """
+        Books all the slots or none of them. Slots are booked with a single
+        update conditioned to them being free, so of two transactions
+        claiming the same slot only the first one to commit gets it
+
+        :raises SlotsAlreadyBooked: when any slot is booked or doesn't exist
+        """
+        slot_ids = set(slot_ids)
+        with transaction.atomic():
+            claimed_slots = models.Slot.objects.filter(
+                id__in=slot_ids,
+                booked=False
+            ).update(booked=True, modified=timezone.now())
+            if claimed_slots != len(slot_ids):
+                raise SlotsAlreadyBooked(
+                    f'Some of slots {sorted(slot_ids)} are not free anymore'
+                )
+            dates = cls._update_booked_slots_masks(slot_ids, booked=True)
+        for date_ in dates:
+            transaction.on_commit(
+                partial(DjangoDayAvailabilityCache.invalidate, date_)
+            )
+
+    @classmethod
+    def refresh_days_masks(cls, day_ids: List[int]):
+        """
+        Rebuilds slots masks of the days from their current slots
+        """
+        days_masks = {day_id: (0, 0) for day_id in day_ids}
+        for day_id, position, booked in models.Slot.objects.filter(
+            day_id__in=day_ids
+        ).values_list('day_id', 'position', 'booked'):
+            slots_mask, booked_slots_mask = days_masks[day_id]
+            slots_mask |= 1 << position
+            if booked:
+                booked_slots_mask |= 1 << position
+            days_masks[day_id] = (slots_mask, booked_slots_mask)
+        with transaction.atomic():
+            for day_id, (slots_mask, booked_slots_mask) in days_masks.items():
+                models.Day.objects.filter(id=day_id).update(
+                    slots_mask=slots_mask,
+                    booked_slots_mask=booked_slots_mask,
+                )
 
     @classmethod
     def filter_price_variations(
@@ -174,6 +476,15 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
         boat_id: int = None,
         date_: date = None
     ) -> List[domain.PriceVariation]:
+        if obj_id is None and boat_id is not None and date_ is not None:
+            price_variation = (
+                DjangoBoatsIntervalIndexes.get().get_price_variation(
+                    boat_id=boat_id,
+                    date_=date_
+                )
+            )
+            return [price_variation] if price_variation else []
+
         django_filters = cls.DATA_ADAPTER.transform(
             id=obj_id,
             boat_id=boat_id,
@@ -189,23 +500,269 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
         ]
 
     @classmethod
-    def delete_days(cls, days: List[domain.Day]):
-        day_ids = [day.id for day in days]
-        models.Day.objects.filter(id__in=day_ids).delete()
+    def exists_days(cls, boat_id: int = None, year: int = None) -> bool:
+        django_filters = cls.DATA_ADAPTER.transform(
+            definition__boat_id=boat_id,
+            date__year=year
+        )
+        return models.Day.objects.filter(**django_filters).exists()
 
     @classmethod
-    def get_day(cls, boat: Boat, date_: date) -> domain.Day:
-        django_filters = cls.DATA_ADAPTER.transform(
-            definition__boat_id=boat.id,
-            date=date_
+    def delete_boat_days(
+        cls,
+        boat_id: int,
+        from_: date,
+        to: date
+    ) -> List[date]:
+        """
+        Deletes the days of the boat between both dates (inclusive) and
+        their slots with a DELETE query per table, without loading them.
+        Days with booked slots or slots of any booking are kept
+
+        :return: dates of the kept days
+        """
+        days = models.Day.objects.filter(
+            definition__boat_id=boat_id,
+            date__gte=from_,
+            date__lte=to
         )
-        try:
-            day = models.Day.objects.get(**django_filters)
-        except models.Day.DoesNotExist:
-            raise NoAvailabilityForDay(
-                'There are not day availability definied for this day'
+        with transaction.atomic():
+            days_with_bookings = days.filter(
+                Q(slots__booked=True) | Q(slots__booking__isnull=False)
+            )
+            kept_dates = sorted(
+                set(days_with_bookings.values_list('date', flat=True))
+            )
+            deletable_days = days.exclude(
+                id__in=days_with_bookings.values('id')
+            )
+            # Slots of these days have no bookings to cascade to, and
+            # caches and summaries are refreshed by the caller, so
+            # objects don't have to be collected by Django
+            models.Slot.objects.filter(day__in=deletable_days)._raw_delete(
+                using=models.Slot.objects.db
+            )
+            deletable_days._raw_delete(using=models.Day.objects.db)
+        return kept_dates
+
+    @classmethod
+    def get_boats_days(
+        cls,
+        boat_ids: List[int],
+        date_: date
+    ) -> Dict[int, domain.BoatDay]:
+        return cls.filter_boats_days(
+            boat_ids=boat_ids,
+            from_=date_,
+            to=date_
+        )[date_]
+
+    @classmethod
+    def filter_boats_days(
+        cls,
+        boat_ids: List[int],
+        from_: date,
+        to: date
+    ) -> Dict[date, Dict[int, domain.BoatDay]]:
+        """
+        Loads days and slots of all the given boats between both dates
+        (inclusive) with a constant number of queries. Day definitions and
+        price variations are resolved from the interval indexes. Boats
+        without day definition or day for a date are omitted from that date
+        """
+        intervals_indexes = DjangoBoatsIntervalIndexes.get()
+        dates = list(daterange(from_, to + timedelta(days=1)))
+        day_definitions = {}
+        for date_ in dates:
+            for boat_id in boat_ids:
+                day_definition = intervals_indexes.get_day_definition(
+                    boat_id=boat_id,
+                    date_=date_
+                )
+                if day_definition:
+                    day_definitions[(boat_id, date_)] = day_definition
+        days = cls.filter_definitions_days(
+            day_definitions={
+                day_definition.id: day_definition
+                for day_definition in day_definitions.values()
+            },
+            from_=from_,
+            to=to
+        )
+
+        boats_days = {}
+        for date_ in dates:
+            boats_days[date_] = {}
+            for boat_id in boat_ids:
+                day_definition = day_definitions.get((boat_id, date_))
+                if not day_definition:
+                    continue
+                day = days.get((day_definition.id, date_))
+                if not day:
+                    continue
+                boats_days[date_][boat_id] = domain.BoatDay(
+                    boat_id=boat_id,
+                    day_definition=day_definition,
+                    day=day,
+                    price_variation=intervals_indexes.get_price_variation(
+                        boat_id=boat_id,
+                        date_=date_
+                    ),
+                )
+        return boats_days
+
+    @classmethod
+    def filter_definitions_days(
+        cls,
+        day_definitions: Dict[int, domain.DayDefinition],
+        from_: date,
+        to: date
+    ) -> Dict[Tuple[int, date], domain.Day]:
+        """
+        :return: days of the given day definitions (by id) between both dates
+            (inclusive) by day definition id and date
+        """
+        return {
+            (day.definition_id, day.date): cls.get_day_domain_object(day)
+            for day in models.Day.objects.filter(
+                definition_id__in=day_definitions,
+                date__gte=from_,
+                date__lte=to,
+            ).prefetch_related('slots')
+        }
+
+    @classmethod
+    def count_slots(
+        cls,
+        boat_ids: List[int],
+        from_: date,
+        to: date
+    ) -> Dict[Tuple[int, date], domain.SlotsCount]:
+        """
+        Total and booked slots of every (boat id, date) between both dates
+        (inclusive) computed from days slots masks with a single query
+        """
+        return cls._count_days_slots(
+            models.Day.objects.filter(
+                definition__boat_id__in=boat_ids,
+                date__gte=from_,
+                date__lte=to,
+            )
+        )
+
+    @staticmethod
+    def _count_days_slots(
+        days: QuerySet
+    ) -> Dict[Tuple[int, date], domain.SlotsCount]:
+        slots_counts = {}
+        for boat_id, date_, slots_mask, booked_slots_mask in days.values_list(
+            'definition__boat_id', 'date', 'slots_mask', 'booked_slots_mask'
+        ):
+            day_slots_count = domain.SlotsCount.from_masks(
+                slots_mask,
+                booked_slots_mask
+            )
+            slots_count = slots_counts.setdefault(
+                (boat_id, date_),
+                domain.SlotsCount(total=0, booked=0)
+            )
+            slots_count.total += day_slots_count.total
+            slots_count.booked += day_slots_count.booked
+        return slots_counts
+
+    @classmethod
+    def filter_days_summaries(
+        cls,
+        boat_ids: List[int],
+        from_: date,
+        to: date
+    ) -> Dict[Tuple[int, date], domain.DaySummary]:
+        days_summaries = models.DaySummary.objects.filter(
+            boat_id__in=boat_ids,
+            date__gte=from_,
+            date__lte=to,
+        )
+        return {
+            (day_summary.boat_id, day_summary.date): (
+                cls.get_day_summary_domain_object(day_summary)
+            )
+            for day_summary in days_summaries
+        }
+
+    @classmethod
+    def refresh_days_summaries(cls, boat_id: int, from_: date, to: date):
+        """
+        Rebuilds the days summaries of a boat between both dates (inclusive)
+        from its current days and slots. Days are locked while they are
+        counted, so concurrent refreshes of the same dates (or bookings of
+        their slots) wait for each other, and summaries are updated in
+        place instead of deleted and created again
+        """
+        with transaction.atomic():
+            slots_counts = cls._count_days_slots(
+                models.Day.objects.select_for_update(of=('self',))
+                .filter(
+                    definition__boat_id=boat_id,
+                    date__gte=from_,
+                    date__lte=to,
+                )
+                .order_by('id')
+            )
+            days_summaries = {
+                day_summary.date: day_summary
+                for day_summary in models.DaySummary.objects.filter(
+                    boat_id=boat_id,
+                    date__gte=from_,
+                    date__lte=to,
+                )
+            }
+            now = timezone.now()
+            new_days_summaries = []
+            updated_days_summaries = []
+            for (_, date_), slots_count in slots_counts.items():
+                day_summary = days_summaries.pop(date_, None)
+                if day_summary is None:
+                    new_days_summaries.append(
+                        models.DaySummary(
+                            boat_id=boat_id,
+                            date=date_,
+                            total_slots=slots_count.total,
+                            booked_slots=slots_count.booked,
+                            availability_type=slots_count.availability_type,
+                        )
+                    )
+                elif (
+                    day_summary.total_slots != slots_count.total
+                    or day_summary.booked_slots != slots_count.booked
+                    or day_summary.availability_type
+                    != slots_count.availability_type
+                ):
+                    day_summary.total_slots = slots_count.total
+                    day_summary.booked_slots = slots_count.booked
+                    day_summary.availability_type = (
+                        slots_count.availability_type
+                    )
+                    day_summary.modified = now
+                    updated_days_summaries.append(day_summary)
+            models.DaySummary.objects.filter(
+                id__in=[
+                    day_summary.id for day_summary in days_summaries.values()
+                ]
+            ).delete()
+            models.DaySummary.objects.bulk_update(
+                updated_days_summaries,
+                [
+                    'total_slots',
+                    'booked_slots',
+                    'availability_type',
+                    'modified',
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE,
+            )
+            models.DaySummary.objects.bulk_create(
+                new_days_summaries,
+                batch_size=BULK_CREATE_BATCH_SIZE
             )
-        return cls.get_day_domain_object(day)
 
     @classmethod
     def get_day_definition_domain_object(
@@ -219,25 +776,51 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
             price_per_hour=day_definition.price_per_hour,
             from_date=day_definition.from_date,
             to_date=day_definition.to_date,
-            boat_id=day_definition.boat.id,
-            days=[
-                cls.get_day_domain_object(day)
-                for day in day_definition.days.all()
-            ],
+            boat_id=day_definition.boat_id,
             n_slots_deal_threshold=day_definition.n_slots_deal_threshold,
             discount_when_deal=day_definition.discount_when_deal,
             resident_discount=day_definition.resident_discount,
         )
 
+    @staticmethod
+    def _update_booked_slots_masks(
+        slot_ids: Iterable[int],
+        booked: bool
+    ) -> Set[date]:
+        """
+        Sets or clears the bits of the slots in the booked slots masks of
+        their days
+
+        :return: dates of the updated days
+        """
+        days_masks = defaultdict(int)
+        dates = set()
+        for day_id, date_, position in models.Slot.objects.filter(
+            id__in=slot_ids
+        ).values_list('day_id', 'day__date', 'position'):
+            days_masks[day_id] |= 1 << position
+            dates.add(date_)
+        for day_id, mask in days_masks.items():
+            if booked:
+                booked_slots_mask = F('booked_slots_mask').bitor(mask)
+            else:
+                booked_slots_mask = F('booked_slots_mask').bitand(~mask)
+            models.Day.objects.filter(id=day_id).update(
+                booked_slots_mask=booked_slots_mask
+            )
+        return dates
+
     @classmethod
     def get_day_domain_object(cls, day: models.Day) -> domain.Day:
         return domain.Day(
             id=day.id,
             date=day.date,
-            day_definition_id=day.definition.id,
+            day_definition_id=day.definition_id,
             slots=[
                 cls.get_slot_domain_object(slot) for slot in day.slots.all()
             ],
+            slots_mask=day.slots_mask,
+            booked_slots_mask=day.booked_slots_mask,
         )
 
     @classmethod
@@ -248,7 +831,19 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
             from_hour=slot.from_hour,
             to_hour=slot.to_hour,
             booked=slot.booked,
-            day_id=slot.day.id,
+            day_id=slot.day_id,
+        )
+
+    @classmethod
+    def get_day_summary_domain_object(
+        cls, day_summary: models.DaySummary
+    ) -> domain.DaySummary:
+        return domain.DaySummary(
+            boat_id=day_summary.boat_id,
+            date=day_summary.date,
+            total_slots=day_summary.total_slots,
+            booked_slots=day_summary.booked_slots,
+            availability_type=day_summary.availability_type,
         )
 
     @classmethod
@@ -259,5 +854,67 @@ class DjangoAvailabilityRepository(AvailabilityRepository):
             from_date=price_variation.from_date,
             to_date=price_variation.to_date,
             factor=price_variation.factor,
-            boat_id=price_variation.boat.id,
+            boat_id=price_variation.boat_id,
         )
+
+
+class DerivedSlotsAvailabilityRepository(DjangoAvailabilityRepository):
+    """
+    Builds the slots of the days read for availability from their day
+    definitions and the booked slots masks of the days instead of loading
+    every slot row. Only slots ids are read from the database because
+    bookings reference slots by id
+    """
+
+    @classmethod
+    def filter_definitions_days(
+        cls,
+        day_definitions: Dict[int, domain.DayDefinition],
+        from_: date,
+        to: date
+    ) -> Dict[Tuple[int, date], domain.Day]:
+        days_slots_ids = defaultdict(dict)
+        for day_id, position, slot_id in models.Slot.objects.filter(
+            day__definition_id__in=day_definitions,
+            day__date__gte=from_,
+            day__date__lte=to,
+        ).values_list('day_id', 'position', 'id'):
+            days_slots_ids[day_id][position] = slot_id
+
+        days = {}
+        for (
+            day_id, definition_id, date_, slots_mask, booked_slots_mask
+        ) in models.Day.objects.filter(
+            definition_id__in=day_definitions,
+            date__gte=from_,
+            date__lte=to,
+        ).values_list(
+            'id', 'definition_id', 'date', 'slots_mask', 'booked_slots_mask'
+        ):
+            day_definition = day_definitions[definition_id]
+            slots_timings = get_slots_timings(
+                first_time=day_definition.first_time,
+                hours_per_slot=day_definition.hours_per_slot
+            )
+            slots = []
+            for position, slot_id in sorted(days_slots_ids[day_id].items()):
+                slot_timing = slots_timings[position % len(slots_timings)]
+                slots.append(
+                    domain.Slot(
+                        id=slot_id,
+                        position=position,
+                        from_hour=slot_timing.from_hour,
+                        to_hour=slot_timing.to_hour,
+                        booked=bool(booked_slots_mask >> position & 1),
+                        day_id=day_id,
+                    )
+                )
+            days[(definition_id, date_)] = domain.Day(
+                id=day_id,
+                date=date_,
+                day_definition_id=definition_id,
+                slots=slots,
+                slots_mask=slots_mask,
+                booked_slots_mask=booked_slots_mask,
+            )
+        return days
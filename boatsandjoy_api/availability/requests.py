@@ -8,6 +8,13 @@ class GetDayAvailabilityRequest:
     apply_resident_discount: bool
 
 
+@dataclass
+class GetRangeAvailabilityRequest:
+    from_date: date
+    to_date: date
+    apply_resident_discount: bool
+
+
 @dataclass
 class GetMonthAvailabilityRequest:
     month: int
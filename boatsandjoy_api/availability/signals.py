@@ -0,0 +1,55 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from boatsandjoy_api.boats.models import Boat
+from boatsandjoy_api.core.caches import invalidate_on_commit
+from .caches import DjangoDayAvailabilityCache
+from .indexes import DjangoBoatsIntervalIndexes
+from .models import Day, DayDefinition, PriceVariation, Slot
+from .repository import DjangoAvailabilityRepository
+
+
+@receiver(post_save, sender=Slot)
+def invalidate_slot_date(sender, instance: Slot, **kwargs):
+    DjangoDayAvailabilityCache.invalidate(instance.day.date)
+
+
+@receiver(post_save, sender=Day)
+@receiver(post_delete, sender=Day)
+def invalidate_day_date(sender, instance: Day, **kwargs):
+    DjangoDayAvailabilityCache.invalidate(instance.date)
+
+
+@receiver(post_delete, sender=Day)
+def refresh_deleted_day_summary(sender, instance: Day, **kwargs):
+    # Days deleted by the generator are raw deleted and summarized by it,
+    # the rest (admin, day definitions cascades) are summarized here
+    boat_id = (
+        DayDefinition.objects.filter(id=instance.definition_id)
+        .values_list('boat_id', flat=True)
+        .first()
+    )
+    if boat_id is not None:
+        DjangoAvailabilityRepository.refresh_days_summaries(
+            boat_id=boat_id,
+            from_=instance.date,
+            to=instance.date
+        )
+
+
+@receiver(post_save, sender=DayDefinition)
+@receiver(post_delete, sender=DayDefinition)
+@receiver(post_save, sender=PriceVariation)
+@receiver(post_delete, sender=PriceVariation)
+@receiver(post_save, sender=Boat)
+@receiver(post_delete, sender=Boat)
+def invalidate_all_dates(sender, instance, **kwargs):
+    DjangoDayAvailabilityCache.invalidate_all()
+
+
+@receiver(post_save, sender=DayDefinition)
+@receiver(post_delete, sender=DayDefinition)
+@receiver(post_save, sender=PriceVariation)
+@receiver(post_delete, sender=PriceVariation)
+def invalidate_boats_interval_indexes(sender, instance, **kwargs):
+    invalidate_on_commit(DjangoBoatsIntervalIndexes.invalidate)
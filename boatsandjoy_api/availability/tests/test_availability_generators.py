@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.exceptions import AvailabilityAlreadyCreated
+from boatsandjoy_api.availability.models import Day, Slot
+from .utils import create_boat, create_day_definition
+
+
+class AvailabilityGeneratorTestCase(TestCase):
+    def setUp(self):
+        self.boat = create_boat()
+        create_day_definition(self.boat)
+
+    def test_generate_year_already_created(self):
+        AvailabilityGenerator(self.boat).generate(2027)
+        days_count = Day.objects.count()
+        slots_count = Slot.objects.count()
+
+        with self.assertRaisesMessage(
+            AvailabilityAlreadyCreated,
+            'Availability of Boat for 2027 already created'
+        ):
+            AvailabilityGenerator(self.boat).generate(2027)
+
+        self.assertEqual(Day.objects.count(), days_count)
+        self.assertEqual(Slot.objects.count(), slots_count)
@@ -0,0 +1,121 @@
+from datetime import date, time
+from typing import List
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+    DatabaseAvailabilityGenerator,
+)
+from boatsandjoy_api.availability.domain import Day
+from boatsandjoy_api.availability.models import DaySummary, Slot
+from boatsandjoy_api.boats.models import Boat
+from .utils import create_boat, create_day_definition
+
+DAY_DEFINITIONS = (
+    {
+        'first_time': time(9),
+        'hours_per_slot': 2,
+        'n_slots': 4,
+        'from_date': date(2027, 1, 1),
+        'to_date': date(2027, 3, 31),
+    },
+    {
+        'first_time': time(10),
+        'hours_per_slot': 2,
+        'n_slots': 0,
+        'from_date': date(2027, 4, 1),
+        'to_date': date(2027, 5, 31),
+    },
+    {
+        'first_time': time(22),
+        'hours_per_slot': 24,
+        'n_slots': 3,
+        'from_date': date(2027, 6, 1),
+        'to_date': date(2027, 8, 31),
+    },
+    {
+        'first_time': time(23, 30),
+        'hours_per_slot': 3,
+        'n_slots': 12,
+        'from_date': date(2027, 9, 1),
+        'to_date': date(2027, 12, 31),
+    },
+)
+
+
+@skipUnless(
+    connection.vendor == 'postgresql',
+    'Days are generated in the database only with PostgreSQL'
+)
+class DatabaseAvailabilityGeneratorTestCase(TestCase):
+    def setUp(self):
+        self.python_boat = create_boat(name='Python')
+        self.database_boat = create_boat(name='Database')
+        for boat in (self.python_boat, self.database_boat):
+            for day_definition in DAY_DEFINITIONS:
+                create_day_definition(boat, **day_definition)
+
+    def test_same_availability_as_python_generator(self):
+        python_days = AvailabilityGenerator(self.python_boat).generate(2027)
+        database_days = DatabaseAvailabilityGenerator(
+            self.database_boat
+        ).generate(2027)
+
+        self.assertEqual(
+            self.get_days_values(database_days),
+            self.get_days_values(python_days)
+        )
+        self.assertEqual(
+            self.get_stored_slots(self.database_boat),
+            self.get_stored_slots(self.python_boat)
+        )
+        self.assertEqual(
+            self.get_stored_days_summaries(self.database_boat),
+            self.get_stored_days_summaries(self.python_boat)
+        )
+
+    @staticmethod
+    def get_days_values(days: List[Day]) -> list:
+        return [
+            (
+                day.date,
+                day.slots_mask,
+                day.booked_slots_mask,
+                [
+                    (slot.position, slot.from_hour, slot.to_hour, slot.booked)
+                    for slot in day.slots
+                ],
+            )
+            for day in sorted(days, key=lambda day: day.date)
+        ]
+
+    @staticmethod
+    def get_stored_slots(boat: Boat) -> list:
+        return list(
+            Slot.objects.filter(day__definition__boat=boat)
+            .order_by('day__date', 'position')
+            .values_list(
+                'day__date',
+                'day__slots_mask',
+                'position',
+                'from_hour',
+                'to_hour',
+                'booked',
+            )
+        )
+
+    @staticmethod
+    def get_stored_days_summaries(boat: Boat) -> list:
+        return list(
+            DaySummary.objects.filter(boat=boat)
+            .order_by('date')
+            .values_list(
+                'date',
+                'total_slots',
+                'booked_slots',
+                'availability_type'
+            )
+        )
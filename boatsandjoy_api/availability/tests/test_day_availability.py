@@ -0,0 +1,53 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.indexes import DjangoBoatsIntervalIndexes
+from boatsandjoy_api.boats.caches import DjangoActiveBoatsCache
+from .utils import create_boat, create_day_definition, create_price_variation
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+        }
+    },
+    AVAILABILITY_CACHE_TIMEOUT=0,
+)
+class DayAvailabilityQueriesTestCase(TestCase):
+    def get_day_availability(self) -> dict:
+        response = self.client.get(
+            reverse(
+                'availability:get-day-availability',
+                kwargs={'date_': '2027-03-12'},
+            )
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def create_boats(self, n_boats: int):
+        for i in range(n_boats):
+            boat = create_boat(name=f'Boat {n_boats}-{i}')
+            create_day_definition(boat)
+            create_price_variation(boat)
+            AvailabilityGenerator(boat).generate(2027)
+        # Changes invalidate them on commit, which never happens in TestCase
+        DjangoActiveBoatsCache.invalidate()
+        DjangoBoatsIntervalIndexes.invalidate()
+
+    def test_queries_do_not_depend_on_fleet_size(self):
+        for n_boats, total_boats in ((1, 1), (3, 4)):
+            self.create_boats(n_boats)
+            self.get_day_availability()
+
+            # Only days and slots are read, boats and indexes are loaded
+            with self.assertNumQueries(2):
+                results = self.get_day_availability()
+
+            self.assertFalse(results['error'])
+            self.assertEqual(len(results['data']), total_boats)
+            for boat_availability in results['data']:
+                self.assertTrue(boat_availability['availability'])
@@ -0,0 +1,120 @@
+from datetime import date
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from boatsandjoy_api.availability.api import api
+from boatsandjoy_api.availability.caches import DjangoDayAvailabilityCache
+from boatsandjoy_api.availability.checks import check_day_availability_cache
+from boatsandjoy_api.availability.requests import GetDayAvailabilityRequest
+
+
+class DayAvailabilityCacheTestCase(TestCase):
+    def setUp(self):
+        cache_dir = TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        shared_cache = override_settings(
+            CACHES={
+                'default': {
+                    'BACKEND': (
+                        'django.core.cache.backends.filebased.FileBasedCache'
+                    ),
+                    'LOCATION': cache_dir.name,
+                }
+            }
+        )
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        self.date = date(2027, 3, 12)
+
+    def get_day_availability(self) -> dict:
+        return api.get_day_availability(
+            GetDayAvailabilityRequest(
+                date=self.date,
+                apply_resident_discount=False
+            )
+        )
+
+    def test_response_computed_during_invalidation_is_not_served(self):
+        def get_stale_day_availability(**kwargs):
+            # A booking of the date commits while the response is computed
+            DjangoDayAvailabilityCache.invalidate(self.date)
+            return ['stale']
+
+        with mock.patch.object(
+            api,
+            '_get_day_availability',
+            side_effect=get_stale_day_availability,
+        ):
+            self.assertEqual(self.get_day_availability()['data'], ['stale'])
+        with mock.patch.object(
+            api,
+            '_get_day_availability',
+            return_value=['fresh'],
+        ):
+            self.assertEqual(self.get_day_availability()['data'], ['fresh'])
+            self.assertEqual(self.get_day_availability()['data'], ['fresh'])
+
+    def test_invalidate_date(self):
+        key = DjangoDayAvailabilityCache.get_key(self.date, False)
+        DjangoDayAvailabilityCache.set(key, {'error': False, 'data': []})
+
+        self.assertEqual(
+            DjangoDayAvailabilityCache.get(key),
+            {'error': False, 'data': []}
+        )
+        DjangoDayAvailabilityCache.invalidate(self.date)
+        self.assertIsNone(
+            DjangoDayAvailabilityCache.get(
+                DjangoDayAvailabilityCache.get_key(self.date, False)
+            )
+        )
+        self.assertIsNotNone(cache.get(key))
+
+    def test_hits_and_misses(self):
+        stats = DjangoDayAvailabilityCache.get_stats()
+
+        with mock.patch.object(api, '_get_day_availability', return_value=[]):
+            self.get_day_availability()
+            self.get_day_availability()
+            self.get_day_availability()
+
+        self.assertEqual(
+            DjangoDayAvailabilityCache.get_stats(),
+            {'hits': stats['hits'] + 2, 'misses': stats['misses'] + 1}
+        )
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'
+        }
+    }
+)
+class LocalMemoryDayAvailabilityCacheTestCase(TestCase):
+    def test_invalidate_date(self):
+        date_ = date(2027, 3, 12)
+        key = DjangoDayAvailabilityCache.get_key(date_, True)
+        DjangoDayAvailabilityCache.set(key, {'error': False, 'data': []})
+
+        self.assertIsNotNone(DjangoDayAvailabilityCache.get(key))
+        DjangoDayAvailabilityCache.invalidate(date_)
+        self.assertIsNone(
+            DjangoDayAvailabilityCache.get(
+                DjangoDayAvailabilityCache.get_key(date_, True)
+            )
+        )
+
+    @override_settings(DEBUG=False)
+    def test_check_warns_about_local_memory_cache(self):
+        self.assertEqual(
+            [warning.id for warning in check_day_availability_cache(None)],
+            ['availability.W001']
+        )
+
+    @override_settings(DEBUG=False, AVAILABILITY_CACHE_TIMEOUT=0)
+    def test_check_ignores_disabled_cache(self):
+        self.assertEqual(check_day_availability_cache(None), [])
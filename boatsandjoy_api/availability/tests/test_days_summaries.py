@@ -0,0 +1,109 @@
+from datetime import date
+
+from django.test import TestCase
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.constants import DayAvailabilityTypes
+from boatsandjoy_api.availability.models import Day, DaySummary, Slot
+from boatsandjoy_api.availability.repository import (
+    DjangoAvailabilityRepository,
+)
+from .utils import create_boat, create_day_definition
+
+
+class RefreshDaysSummariesTestCase(TestCase):
+    def setUp(self):
+        self.boat = create_boat()
+        create_day_definition(self.boat)
+        AvailabilityGenerator(self.boat).generate(2027)
+        self.date = date(2027, 6, 1)
+
+    def refresh_days_summaries(self):
+        DjangoAvailabilityRepository.refresh_days_summaries(
+            boat_id=self.boat.id,
+            from_=date(2027, 5, 31),
+            to=date(2027, 6, 2),
+        )
+
+    def test_summaries_are_updated_in_place(self):
+        day_summary = DaySummary.objects.get(boat=self.boat, date=self.date)
+        DjangoAvailabilityRepository.set_slots_booked(
+            slot_ids=list(
+                Slot.objects.filter(day__date=self.date)
+                .values_list('id', flat=True)[:2]
+            ),
+            booked=True,
+        )
+
+        self.refresh_days_summaries()
+        self.refresh_days_summaries()
+
+        updated_day_summary = DaySummary.objects.get(
+            boat=self.boat,
+            date=self.date
+        )
+        self.assertEqual(updated_day_summary.id, day_summary.id)
+        self.assertEqual(updated_day_summary.booked_slots, 2)
+        self.assertEqual(
+            updated_day_summary.availability_type,
+            DayAvailabilityTypes.PARTIALLY_FREE
+        )
+        self.assertEqual(
+            DaySummary.objects.filter(boat=self.boat).count(),
+            Day.objects.filter(definition__boat=self.boat).count()
+        )
+
+    def test_summaries_of_deleted_days_are_deleted(self):
+        DjangoAvailabilityRepository.delete_boat_days(
+            boat_id=self.boat.id,
+            from_=self.date,
+            to=self.date
+        )
+
+        self.refresh_days_summaries()
+
+        self.assertFalse(
+            DaySummary.objects.filter(boat=self.boat, date=self.date).exists()
+        )
+        self.assertEqual(
+            DaySummary.objects.filter(
+                boat=self.boat,
+                date__in=[date(2027, 5, 31), date(2027, 6, 2)]
+            ).count(),
+            2
+        )
+
+
+class DeletedDaysSummariesTestCase(TestCase):
+    def setUp(self):
+        self.boat = create_boat()
+        self.day_definition = create_day_definition(self.boat)
+        AvailabilityGenerator(self.boat).generate(2027)
+
+    def test_deleted_day(self):
+        Day.objects.get(date=date(2027, 6, 1)).delete()
+
+        self.assertFalse(
+            DaySummary.objects.filter(date=date(2027, 6, 1)).exists()
+        )
+        self.assertTrue(
+            DaySummary.objects.filter(date=date(2027, 6, 2)).exists()
+        )
+
+    def test_deleted_day_definition(self):
+        other_day_definition = create_day_definition(
+            self.boat,
+            from_date=date(2028, 1, 1),
+            to_date=date(2028, 12, 31),
+        )
+        AvailabilityGenerator(self.boat).generate(2028)
+
+        other_day_definition.delete()
+
+        self.assertFalse(DaySummary.objects.filter(date__year=2028).exists())
+        self.assertEqual(
+            DaySummary.objects.filter(date__year=2027).count(),
+            Day.objects.count()
+        )
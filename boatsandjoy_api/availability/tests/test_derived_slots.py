@@ -0,0 +1,171 @@
+from datetime import date, time, timedelta
+
+from django.test import TestCase, override_settings
+
+from boatsandjoy_api.availability.api import AvailabilityApi
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.caches import DjangoDayAvailabilityCache
+from boatsandjoy_api.availability.indexes import DjangoBoatsIntervalIndexes
+from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.repository import (
+    DerivedSlotsAvailabilityRepository,
+    DjangoAvailabilityRepository,
+)
+from boatsandjoy_api.availability.requests import (
+    GetDayAvailabilityRequest,
+    GetRangeAvailabilityRequest,
+)
+from boatsandjoy_api.boats.caches import DjangoActiveBoatsCache
+from boatsandjoy_api.core.responses import (
+    ErrorResponseBuilder,
+    ResponseBuilder,
+    StreamResponseBuilder,
+)
+from .utils import create_boat, create_day_definition, create_price_variation
+
+DATES = (
+    date(2027, 3, 12),
+    date(2027, 6, 30),
+    date(2027, 7, 1),
+    date(2027, 9, 15),
+)
+RANGES = (
+    (date(2027, 3, 8), date(2027, 3, 22)),
+    (date(2027, 6, 25), date(2027, 7, 5)),
+)
+
+
+def get_api(availability_repository) -> AvailabilityApi:
+    return AvailabilityApi(
+        availability_repository,
+        ResponseBuilder,
+        ErrorResponseBuilder,
+        StreamResponseBuilder,
+        DjangoDayAvailabilityCache,
+    )
+
+
+@override_settings(AVAILABILITY_CACHE_TIMEOUT=0)
+class DerivedSlotsAvailabilityTestCase(TestCase):
+    """
+    Availability built from days masks and definitions has to be the one
+    built from slots rows
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        boat = create_boat(name='Llaüt')
+        create_day_definition(boat, to_date=date(2027, 6, 30))
+        create_day_definition(
+            boat,
+            from_date=date(2027, 7, 1),
+            first_time=time(10, 30),
+            hours_per_slot=1.5,
+            n_slots=5,
+        )
+        create_price_variation(boat)
+        AvailabilityGenerator(boat).generate(2027)
+        other_boat = create_boat(name='Gozzo')
+        create_day_definition(other_boat, hours_per_slot=3, n_slots=3)
+        AvailabilityGenerator(other_boat).generate(2027)
+        create_boat(name='Inactive', active=False)
+
+        cls.booked_slot_ids = [
+            *cls.get_slot_ids(boat, date(2027, 3, 12), positions=(0, 1)),
+            *cls.get_slot_ids(other_boat, date(2027, 3, 12), positions=(2,)),
+            *cls.get_slot_ids(boat, date(2027, 6, 30)),
+            *cls.get_slot_ids(boat, date(2027, 7, 1), positions=(1, 3)),
+        ]
+        DjangoAvailabilityRepository.set_slots_booked(
+            cls.booked_slot_ids,
+            booked=True
+        )
+
+    @staticmethod
+    def get_slot_ids(boat, date_: date, positions: tuple = None) -> list:
+        slots = Slot.objects.filter(
+            day__definition__boat=boat,
+            day__date=date_
+        )
+        if positions is not None:
+            slots = slots.filter(position__in=positions)
+        return list(slots.values_list('id', flat=True))
+
+    def setUp(self):
+        # Changes invalidate them on commit, which never happens in TestCase
+        DjangoActiveBoatsCache.invalidate()
+        DjangoBoatsIntervalIndexes.invalidate()
+        self.slots_api = get_api(DjangoAvailabilityRepository)
+        self.derived_slots_api = get_api(DerivedSlotsAvailabilityRepository)
+
+    def assert_no_booked_slots(self, boats_availability: list):
+        for boat_availability in boats_availability:
+            for combination in boat_availability['availability']:
+                for slot in combination['slots']:
+                    self.assertNotIn(slot['id'], self.booked_slot_ids)
+
+    def test_day_availability(self):
+        for date_ in DATES:
+            for apply_resident_discount in (False, True):
+                request = GetDayAvailabilityRequest(
+                    date=date_,
+                    apply_resident_discount=apply_resident_discount,
+                )
+                with self.subTest(request=request):
+                    results = self.slots_api.get_day_availability(request)
+
+                    self.assertFalse(results['error'])
+                    self.assertEqual(
+                        self.derived_slots_api.get_day_availability(request),
+                        results
+                    )
+                    self.assert_no_booked_slots(results['data'])
+
+    def test_booked_slots(self):
+        request = GetDayAvailabilityRequest(
+            date=date(2027, 6, 30),
+            apply_resident_discount=False,
+        )
+
+        for api in (self.slots_api, self.derived_slots_api):
+            with self.subTest(api=api.availability_repository.__name__):
+                results = api.get_day_availability(request)
+
+                # Every slot of the first boat is booked that day
+                self.assertEqual(
+                    [
+                        boat_availability['boat']['name']
+                        for boat_availability in results['data']
+                    ],
+                    ['Gozzo']
+                )
+
+    def test_range_availability(self):
+        for from_date, to_date in RANGES:
+            for apply_resident_discount in (False, True):
+                request = GetRangeAvailabilityRequest(
+                    from_date=from_date,
+                    to_date=to_date,
+                    apply_resident_discount=apply_resident_discount,
+                )
+                with self.subTest(request=request):
+                    results = self.slots_api.get_range_availability(request)
+                    derived_slots_results = (
+                        self.derived_slots_api.get_range_availability(request)
+                    )
+
+                    data = list(results['data'])
+                    self.assertEqual(
+                        len(data),
+                        (to_date - from_date + timedelta(days=1)).days
+                    )
+                    self.assertEqual(
+                        list(derived_slots_results['data']),
+                        data
+                    )
+                    for day_availability in data:
+                        self.assert_no_booked_slots(
+                            day_availability['availability']
+                        )
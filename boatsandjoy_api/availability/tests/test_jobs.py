@@ -0,0 +1,47 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from boatsandjoy_api.availability.constants import (
+    AvailabilityJobActions,
+    AvailabilityJobStatus,
+)
+from boatsandjoy_api.availability.models import AvailabilityJob, Day
+from .utils import create_boat, create_day_definition
+
+
+class StaleAvailabilityJobsTestCase(TestCase):
+    def setUp(self):
+        self.boat = create_boat()
+        create_day_definition(self.boat)
+
+    def create_running_job(self, running_for: timedelta) -> AvailabilityJob:
+        return AvailabilityJob.objects.create(
+            boat=self.boat,
+            action=AvailabilityJobActions.GENERATE,
+            year=2027,
+            status=AvailabilityJobStatus.RUNNING,
+            started=timezone.now() - running_for,
+        )
+
+    def test_stale_running_jobs_are_run_again(self):
+        stale_job = self.create_running_job(running_for=timedelta(hours=1))
+        running_job = self.create_running_job(running_for=timedelta(0))
+
+        # Workers write their progress to the process stdout
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            call_command(
+                'run_availability_jobs',
+                '--once',
+                '--stale-after=1800'
+            )
+
+        stale_job.refresh_from_db()
+        running_job.refresh_from_db()
+        self.assertEqual(stale_job.status, AvailabilityJobStatus.DONE)
+        self.assertEqual(running_job.status, AvailabilityJobStatus.RUNNING)
+        self.assertTrue(Day.objects.filter(date__year=2027).exists())
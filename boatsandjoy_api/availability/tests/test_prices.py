@@ -0,0 +1,101 @@
+import random
+from datetime import date, time
+from decimal import Decimal
+from typing import List
+
+from django.test import SimpleTestCase
+
+from boatsandjoy_api.availability import domain
+from boatsandjoy_api.availability.api import AvailabilityApi
+from boatsandjoy_api.availability.repository import AvailabilityRepository
+
+
+def get_combinations_prices_per_combination(
+    day_definition: domain.DayDefinition,
+    price_per_hour: Decimal,
+    combinations: List[List[domain.Slot]],
+    apply_resident_discount: bool,
+) -> List[Decimal]:
+    """
+    Pricing as it was done before prices were computed once per length
+    """
+    hours_per_slot = day_definition.hours_per_slot
+    prices = []
+    for combination in combinations:
+        price = len(combination) * hours_per_slot * price_per_hour
+        if (
+            len(combination) >= day_definition.n_slots_deal_threshold
+            and day_definition.discount_when_deal
+        ):
+            price = price - price * Decimal(day_definition.discount_when_deal)
+        if apply_resident_discount:
+            price = price - price * Decimal(day_definition.resident_discount)
+        prices.append(round(price, 2))
+    return prices
+
+
+class CombinationsPricesTestCase(SimpleTestCase):
+    def test_same_prices_as_per_combination_pricing(self):
+        rand = random.Random(7)
+        for _ in range(2000):
+            n_slots = rand.randint(1, 12)
+            day_definition = domain.DayDefinition(
+                id=1,
+                first_time=time(8),
+                hours_per_slot=rand.randint(1, 4),
+                n_slots=n_slots,
+                price_per_hour=Decimal(rand.randint(100, 99999)) / 100,
+                from_date=date(2027, 1, 1),
+                to_date=date(2027, 12, 31),
+                boat_id=1,
+                n_slots_deal_threshold=rand.randint(0, n_slots + 1),
+                discount_when_deal=rand.choice(
+                    [0, 0.1, 0.15, rand.random()]
+                ),
+                resident_discount=rand.choice([0, 0.25, rand.random()]),
+            )
+            price_variation = domain.PriceVariation(
+                from_date=date(2027, 1, 1),
+                to_date=date(2027, 12, 31),
+                factor=rand.choice([0, 1.37, rand.uniform(0.5, 2)]),
+                boat_id=1,
+            )
+            price_per_hour = AvailabilityRepository.calculate_price_per_hour(
+                day_definition,
+                price_variation
+            )
+            slots = [
+                domain.Slot(
+                    id=position,
+                    position=position,
+                    from_hour=time(8),
+                    to_hour=time(9),
+                    booked=False,
+                    day_id=1,
+                )
+                for position in range(n_slots)
+            ]
+            combinations = [
+                slots[start:end]
+                for start in range(n_slots)
+                for end in range(start + 1, n_slots + 1)
+            ]
+            apply_resident_discount = rand.random() < 0.5
+
+            prices = AvailabilityApi._get_combinations_prices(
+                day_definition=day_definition,
+                price_per_hour=price_per_hour,
+                combinations=combinations,
+                apply_resident_discount=apply_resident_discount,
+            )
+            expected_prices = get_combinations_prices_per_combination(
+                day_definition=day_definition,
+                price_per_hour=price_per_hour,
+                combinations=combinations,
+                apply_resident_discount=apply_resident_discount,
+            )
+
+            self.assertEqual(
+                [(price, price.as_tuple()) for price in prices],
+                [(price, price.as_tuple()) for price in expected_prices],
+            )
@@ -0,0 +1,125 @@
+import json
+from datetime import date, timedelta
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.constants import MAX_RANGE_AVAILABILITY_DAYS
+from boatsandjoy_api.availability.indexes import DjangoBoatsIntervalIndexes
+from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.repository import (
+    DjangoAvailabilityRepository,
+)
+from boatsandjoy_api.boats.caches import DjangoActiveBoatsCache
+from .utils import create_boat, create_day_definition, create_price_variation
+
+
+class RangeAvailabilityInvalidRangesTestCase(TestCase):
+    def get_range_availability(self, from_date: str, to_date: str) -> dict:
+        response = self.client.get(
+            reverse(
+                'availability:get-range-availability',
+                kwargs={'from_date': from_date, 'to_date': to_date},
+            )
+        )
+        self.assertEqual(response.status_code, 400)
+        return json.loads(response.content)
+
+    def test_from_date_greater_than_to_date(self):
+        results = self.get_range_availability('2027-03-05', '2027-03-01')
+
+        self.assertTrue(results['error'])
+        self.assertIn('From date is greater than to date', results['data'])
+
+    def test_range_longer_than_maximum(self):
+        results = self.get_range_availability('2027-03-01', '2027-05-01')
+
+        self.assertTrue(results['error'])
+        self.assertIn(
+            f'Ranges can not be longer than {MAX_RANGE_AVAILABILITY_DAYS}',
+            results['data']
+        )
+
+
+@override_settings(AVAILABILITY_CACHE_TIMEOUT=0)
+class RangeAvailabilityTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in ('Llaüt', 'Gozzo'):
+            boat = create_boat(name=name)
+            create_day_definition(boat)
+            create_price_variation(boat)
+            AvailabilityGenerator(boat).generate(2027)
+        DjangoAvailabilityRepository.set_slots_booked(
+            list(
+                Slot.objects.filter(
+                    day__definition__boat=boat,
+                    day__date=date(2027, 3, 12),
+                    position__in=(0, 1),
+                ).values_list('id', flat=True)
+            ),
+            booked=True
+        )
+
+    def setUp(self):
+        # Changes invalidate them on commit, which never happens in TestCase
+        DjangoActiveBoatsCache.invalidate()
+        DjangoBoatsIntervalIndexes.invalidate()
+
+    def get_json(self, url: str, apply_resident_discount: bool):
+        response = self.client.get(
+            url,
+            {'apply_resident_discount': int(apply_resident_discount)}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        content = (
+            b''.join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+        return json.loads(content)
+
+    def test_range_availability(self):
+        from_date = date(2027, 3, 8)
+        to_date = date(2027, 3, 22)
+        dates = [
+            from_date + timedelta(days=i)
+            for i in range((to_date - from_date).days + 1)
+        ]
+
+        for apply_resident_discount in (False, True):
+            with self.subTest(apply_resident_discount=apply_resident_discount):
+                results = self.get_json(
+                    reverse(
+                        'availability:get-range-availability',
+                        kwargs={
+                            'from_date': from_date.isoformat(),
+                            'to_date': to_date.isoformat(),
+                        },
+                    ),
+                    apply_resident_discount
+                )
+
+                self.assertFalse(results['error'])
+                self.assertEqual(
+                    [result['date'] for result in results['data']],
+                    [date_.isoformat() for date_ in dates]
+                )
+                for result in results['data']:
+                    day_results = self.get_json(
+                        reverse(
+                            'availability:get-day-availability',
+                            kwargs={'date_': result['date']},
+                        ),
+                        apply_resident_discount
+                    )
+                    self.assertFalse(day_results['error'])
+                    self.assertEqual(len(day_results['data']), 2)
+                    self.assertEqual(
+                        result['availability'],
+                        day_results['data']
+                    )
@@ -0,0 +1,35 @@
+from datetime import date, time
+from decimal import Decimal
+
+from boatsandjoy_api.availability.models import DayDefinition, PriceVariation
+from boatsandjoy_api.boats.models import Boat
+
+
+def create_boat(name: str = 'Boat', active: bool = True) -> Boat:
+    return Boat.objects.create(name=name, active=active)
+
+
+def create_day_definition(boat: Boat, **kwargs) -> DayDefinition:
+    fields = {
+        'first_time': time(9),
+        'hours_per_slot': 2,
+        'n_slots': 4,
+        'price_per_hour': Decimal('12.35'),
+        'from_date': date(2027, 1, 1),
+        'to_date': date(2027, 12, 31),
+        'n_slots_deal_threshold': 2,
+        'discount_when_deal': 0.1,
+        'resident_discount': 0.25,
+    }
+    fields.update(kwargs)
+    return DayDefinition.objects.create(boat=boat, **fields)
+
+
+def create_price_variation(boat: Boat, **kwargs) -> PriceVariation:
+    fields = {
+        'from_date': date(2027, 3, 10),
+        'to_date': date(2027, 3, 20),
+        'factor': 1.37,
+    }
+    fields.update(kwargs)
+    return PriceVariation.objects.create(boat=boat, **fields)
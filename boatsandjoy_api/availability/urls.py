@@ -1,18 +1,39 @@
+from django.conf import settings
 from django.urls import re_path
 
-from .views import get_day_availability, get_month_availability
+from .views import (
+    async_get_day_availability,
+    async_get_month_availability,
+    get_day_availability,
+    get_month_availability,
+    get_range_availability,
+)
 
 app_name = 'availability'
 
 urlpatterns = [
     re_path(
         r'day/(?P<date_>\d{4}-\d{2}-\d{2})/',
-        get_day_availability,
+        (
+            async_get_day_availability
+            if settings.AVAILABILITY_ASYNC_VIEWS
+            else get_day_availability
+        ),
         name='get-day-availability',
     ),
+    re_path(
+        r'range/(?P<from_date>\d{4}-\d{2}-\d{2})/'
+        r'(?P<to_date>\d{4}-\d{2}-\d{2})/',
+        get_range_availability,
+        name='get-range-availability',
+    ),
     re_path(
         r'month/(?P<date_>\d{4}-\d{2}-\d{2})/',
-        get_month_availability,
+        (
+            async_get_month_availability
+            if settings.AVAILABILITY_ASYNC_VIEWS
+            else get_month_availability
+        ),
         name='get-month-availability',
     ),
 ]
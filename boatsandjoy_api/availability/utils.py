@@ -1,7 +1,11 @@
 from calendar import Calendar
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Tuple
 
-from .domain import DateRange
+from .domain import DateRange, SlotTiming
+
+HOURS_PER_DAY = 24
 
 
 def daterange(start_date: date, end_date: date):
@@ -20,3 +24,30 @@ def date_ranges_collision(date_range_1: DateRange, date_range_2: DateRange):
 def month_date_iter(year, month):
     calendar = Calendar()
     return [d for d in calendar.itermonthdates(year, month) if d.month == month]
+
+
+@lru_cache(maxsize=128)
+def get_slots_timings(
+    first_time: time,
+    hours_per_slot: int
+) -> Tuple[SlotTiming, ...]:
+    """
+    Timings of the slots of a day definition by position. Slot hours wrap
+    around midnight so they repeat every 24 positions and the table for a
+    (first_time, hours_per_slot) pair never has to change, an edited
+    day definition just uses another table
+    """
+    first_datetime = datetime.combine(date(1, 1, 1), first_time)
+    slots_timings = []
+    for position in range(HOURS_PER_DAY):
+        from_datetime = first_datetime + timedelta(
+            hours=hours_per_slot * position
+        )
+        to_datetime = from_datetime + timedelta(hours=hours_per_slot)
+        slots_timings.append(
+            SlotTiming(
+                from_hour=from_datetime.time(),
+                to_hour=to_datetime.time()
+            )
+        )
+    return tuple(slots_timings)
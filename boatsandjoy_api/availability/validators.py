@@ -1,6 +1,7 @@
 from django import forms
 
 from boatsandjoy_api.core.validators import DjangoRequestValidator
+from .constants import MAX_RANGE_AVAILABILITY_DAYS
 
 
 class DjangoGetAvailabilityForm(forms.Form):
@@ -12,6 +13,32 @@ class GetAvailabilityRequestValidator(DjangoRequestValidator):
     FORM = DjangoGetAvailabilityForm
 
 
+class DjangoGetRangeAvailabilityForm(forms.Form):
+    from_date = forms.DateField(required=True)
+    to_date = forms.DateField(required=True)
+    apply_resident_discount = forms.BooleanField(required=False)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        from_date = cleaned_data.get('from_date')
+        to_date = cleaned_data.get('to_date')
+        if from_date and to_date:
+            if from_date > to_date:
+                raise forms.ValidationError(
+                    'From date is greater than to date'
+                )
+            if (to_date - from_date).days >= MAX_RANGE_AVAILABILITY_DAYS:
+                raise forms.ValidationError(
+                    f'Ranges can not be longer than '
+                    f'{MAX_RANGE_AVAILABILITY_DAYS} days'
+                )
+        return cleaned_data
+
+
+class GetRangeAvailabilityRequestValidator(DjangoRequestValidator):
+    FORM = DjangoGetRangeAvailabilityForm
+
+
 class DjangoGetMonthAvailabilityForm(forms.Form):
     month = forms.IntegerField(required=True)
     year = forms.IntegerField(required=True)
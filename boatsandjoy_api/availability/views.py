@@ -1,10 +1,25 @@
+from typing import Iterator
+
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
+from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from boatsandjoy_api.core.utils import cast_to_date
+from boatsandjoy_api.core.responses import get_json_renderer, json_response
+from boatsandjoy_api.core.utils import cast_to_date, run_in_thread_pool
 from .api import api as availability_api
-from .requests import GetDayAvailabilityRequest, GetMonthAvailabilityRequest
+from .requests import (
+    GetDayAvailabilityRequest,
+    GetMonthAvailabilityRequest,
+    GetRangeAvailabilityRequest,
+)
 
 
 @api_view(['GET'])
@@ -40,6 +55,52 @@ def get_day_availability(request: Request, date_: str) -> Response:
     return Response(results)
 
 
+@api_view(['GET'])
+def get_range_availability(
+    request: Request,
+    from_date: str,
+    to_date: str
+) -> HttpResponseBase:
+    """
+    Get boats day availability for every date between both dates (inclusive).
+    Results are streamed date by date. Invalid ranges get a 400 response
+    with the error
+
+    :return: {
+        'error': bool,
+        'data': [
+            {
+                'date': date,
+                'availability': get_day_availability data of this date
+            },
+            ...
+        ]
+    }
+    """
+    api_request = GetRangeAvailabilityRequest(
+        from_date=cast_to_date(from_date),
+        to_date=cast_to_date(to_date),
+        apply_resident_discount=get_apply_resident_discount(request),
+    )
+    results = availability_api.get_range_availability(api_request)
+    if results['error']:
+        return Response(results, status=status.HTTP_400_BAD_REQUEST)
+    return StreamingHttpResponse(
+        stream_json(results),
+        content_type='application/json'
+    )
+
+
+def stream_json(results: dict) -> Iterator[bytes]:
+    renderer = get_json_renderer()
+    yield b'{"error":' + renderer.render(results['error']) + b',"data":['
+    for i, result in enumerate(results['data']):
+        if i:
+            yield b','
+        yield renderer.render(result)
+    yield b']}'
+
+
 def get_apply_resident_discount(request: Request) -> bool:
     if 'apply_resident_discount' in request.GET:
         return bool(int(request.GET['apply_resident_discount']))
@@ -70,3 +131,46 @@ def get_month_availability(request: Request, date_: str) -> Response:
     )
     results = availability_api.get_month_availability(request=api_request)
     return Response(results)
+
+
+async def async_get_day_availability(
+    request: HttpRequest,
+    date_: str
+) -> HttpResponse:
+    """
+    ASGI variant of get_day_availability that doesn't block the event loop
+    while availability is computed
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    api_request = GetDayAvailabilityRequest(
+        date=cast_to_date(date_),
+        apply_resident_discount=get_apply_resident_discount(request)
+    )
+    results = await run_in_thread_pool(
+        availability_api.get_day_availability,
+        api_request
+    )
+    return json_response(results)
+
+
+async def async_get_month_availability(
+    request: HttpRequest,
+    date_: str
+) -> HttpResponse:
+    """
+    ASGI variant of get_month_availability that doesn't block the event
+    loop while availability is computed
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    date_ = cast_to_date(date_)
+    api_request = GetMonthAvailabilityRequest(
+        month=date_.month,
+        year=date_.year
+    )
+    results = await run_in_thread_pool(
+        availability_api.get_month_availability,
+        api_request
+    )
+    return json_response(results)
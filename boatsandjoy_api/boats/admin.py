@@ -8,17 +8,17 @@ from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 
-from boatsandjoy_api.availability.availability_generators import (
-    AvailabilityGenerator,
-)
+from boatsandjoy_api.availability.caches import DjangoDayAvailabilityCache
+from boatsandjoy_api.availability.constants import AvailabilityJobActions
 from boatsandjoy_api.availability.domain import DateRange
 from boatsandjoy_api.availability.models import (
     Day,
     DayDefinition,
     PriceVariation,
 )
+from boatsandjoy_api.availability.jobs import AvailabilityJobsQueue
 from boatsandjoy_api.availability.utils import date_ranges_collision
-from boatsandjoy_api.core.exceptions import BoatsAndJoyException
+from .caches import DjangoActiveBoatsCache
 from .models import Boat
 
 
@@ -118,6 +118,18 @@ class PriceVariationInlineAdmin(admin.StackedInline):
         return True
 
 
+def add_enqueued_jobs_message(request: HttpRequest):
+    url = reverse('admin:availability_availabilityjob_changelist')
+    messages.add_message(
+        request,
+        messages.INFO,
+        mark_safe(
+            f'Availability jobs enqueued, check their progress in '
+            f'<a href="{url}">availability jobs</a>'
+        ),
+    )
+
+
 def generate_availability_for(
     modeladmin,
     request: HttpRequest,
@@ -132,16 +144,12 @@ def generate_availability_for(
             request, messages.ERROR, 'You have to specify a year'
         )
         return
-    for boat in queryset:
-        try:
-            availability_generator = AvailabilityGenerator(boat)
-            availability_generator.generate(year)
-        except BoatsAndJoyException as e:
-            messages.add_message(
-                request,
-                messages.ERROR,
-                f'Unable to generate availability for boat {boat} because {e}',
-            )
+    AvailabilityJobsQueue.enqueue(
+        boat_ids=list(queryset.values_list('id', flat=True)),
+        action=AvailabilityJobActions.GENERATE,
+        year=year,
+    )
+    add_enqueued_jobs_message(request)
 
 
 generate_availability_for.short_description = 'Generate availability for year'
@@ -161,16 +169,12 @@ def delete_availability_for(
             request, messages.ERROR, 'You have to specify a year'
         )
         return
-    for boat in queryset:
-        try:
-            availability_generator = AvailabilityGenerator(boat)
-            availability_generator.delete(year)
-        except BoatsAndJoyException as e:
-            messages.add_message(
-                request,
-                messages.ERROR,
-                f'Unable to delete availability for boat {boat} because {e}',
-            )
+    AvailabilityJobsQueue.enqueue(
+        boat_ids=list(queryset.values_list('id', flat=True)),
+        action=AvailabilityJobActions.DELETE,
+        year=year,
+    )
+    add_enqueued_jobs_message(request)
 
 
 delete_availability_for.short_description = 'Delete availability for year'
@@ -182,6 +186,8 @@ def deactivate_selected_boats(
     queryset: QuerySet
 ):
     queryset.update(active=False)
+    DjangoActiveBoatsCache.invalidate()
+    DjangoDayAvailabilityCache.invalidate_all()
 
 
 deactivate_selected_boats.short_description = 'Deactivate selected boats'
@@ -1,11 +1,13 @@
 from dataclasses import asdict
-from typing import Type
+from typing import Tuple, Type
 
 from boatsandjoy_api.core.responses import (
     ErrorResponseBuilder,
     ResponseBuilder,
     ResponseBuilderInterface,
 )
+from .caches import ActiveBoatsCacheInterface, DjangoActiveBoatsCache
+from .domain import Boat
 from .exceptions import BoatsApiException
 from .repository import BoatsRepository, DjangoBoatsRepository
 from .requests import FilterBoatsRequest
@@ -18,28 +20,55 @@ class BoatsApi:
         boats_repository: Type[BoatsRepository],
         response_builder: Type[ResponseBuilderInterface],
         error_builder: Type[ResponseBuilderInterface],
+        active_boats_cache: Type[ActiveBoatsCacheInterface],
     ):
         self.boats_repository = boats_repository
         self.response_builder = response_builder
         self.error_builder = error_builder
+        self.active_boats_cache = active_boats_cache
 
-    def filter(self, request: FilterBoatsRequest) -> dict:
+    def filter(
+        self,
+        request: FilterBoatsRequest,
+        validate: bool = True
+    ) -> dict:
+        """
+        Internal callers with trusted requests can skip their validation
+        """
         try:
-            FilterBoatsRequestValidator.validate(request)
+            if validate:
+                FilterBoatsRequestValidator.validate(request)
             boats = self.boats_repository.filter(**asdict(request))
             return self.response_builder(boats).build()
 
         except BoatsApiException as e:
             return self.error_builder(e).build()
 
-    def get(self, request: FilterBoatsRequest) -> dict:
+    def get(
+        self,
+        request: FilterBoatsRequest,
+        validate: bool = True
+    ) -> dict:
         try:
-            FilterBoatsRequestValidator.validate(request)
+            if validate:
+                FilterBoatsRequestValidator.validate(request)
             boat = self.boats_repository.get(**asdict(request))
             return self.response_builder(boat).build()
 
         except BoatsApiException as e:
             return self.error_builder(e).build()
 
+    def get_active_boats(self) -> Tuple[Boat, ...]:
+        """
+        Shared snapshot of the active boats for internal callers that
+        need them on every request, boats must not be modified
+        """
+        return self.active_boats_cache.get()
+
 
-api = BoatsApi(DjangoBoatsRepository, ResponseBuilder, ErrorResponseBuilder)
+api = BoatsApi(
+    DjangoBoatsRepository,
+    ResponseBuilder,
+    ErrorResponseBuilder,
+    DjangoActiveBoatsCache,
+)
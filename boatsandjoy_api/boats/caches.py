@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+from boatsandjoy_api.core.caches import VersionedSnapshot
+from . import domain
+from .repository import DjangoBoatsRepository
+
+
+class ActiveBoatsCacheInterface(ABC):
+    @classmethod
+    @abstractmethod
+    def get(cls) -> Tuple[domain.Boat, ...]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def invalidate(cls):
+        pass
+
+
+class DjangoActiveBoatsCache(VersionedSnapshot, ActiveBoatsCacheInterface):
+    """
+    Process local snapshot of the active boats shared by every request,
+    boats changes bump its version
+    """
+
+    VERSION_KEY = 'boats:active:version'
+    TIMEOUT_SETTING = 'BOATS_CACHE_TIMEOUT'
+
+    @classmethod
+    def get(cls) -> Tuple[domain.Boat, ...]:
+        return super().get()
+
+    @classmethod
+    def _load(cls) -> Tuple[domain.Boat, ...]:
+        return tuple(DjangoBoatsRepository.filter(active=True))
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from boatsandjoy_api.core.caches import invalidate_on_commit
+from .caches import DjangoActiveBoatsCache
+from .models import Boat
+
+
+@receiver(post_save, sender=Boat)
+@receiver(post_delete, sender=Boat)
+def invalidate_active_boats(sender, instance: Boat, **kwargs):
+    invalidate_on_commit(DjangoActiveBoatsCache.invalidate)
@@ -1,12 +1,19 @@
+from functools import partial
+
 from django.contrib import admin, messages
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.safestring import mark_safe
 
+from boatsandjoy_api.availability.repository import (
+    DjangoAvailabilityRepository,
+)
 from boatsandjoy_api.core.exceptions import BoatsAndJoyException
 from .constants import BookingStatus
 from .exceptions import BookingAlreadyConfirmed, BookingAlreadyPending
 from .models import Booking
+from .repository import DjangoBookingsRepository
 
 
 def confirm_booking(modeladmin, request: HttpRequest, queryset: QuerySet):
@@ -16,11 +23,9 @@ def confirm_booking(modeladmin, request: HttpRequest, queryset: QuerySet):
                 raise BookingAlreadyConfirmed(
                     f'Booking {booking.locator} already confirmed!'
                 )
-            booking.status = BookingStatus.CONFIRMED
-            booking.save()
-            for slot in booking.slots.all():
-                slot.booked = True
-                slot.save()
+            DjangoBookingsRepository.mark_as_paid(
+                DjangoBookingsRepository.get(obj_id=booking.id)
+            )
 
         except BoatsAndJoyException as e:
             messages.add_message(request, messages.ERROR, str(e))
@@ -29,15 +34,26 @@ def confirm_booking(modeladmin, request: HttpRequest, queryset: QuerySet):
 def unconfirm_booking(modeladmin, request: HttpRequest, queryset: QuerySet):
     for booking in queryset:
         try:
-            if booking.status == BookingStatus.PENDING:
-                raise BookingAlreadyPending(
-                    f'Booking {booking.locator} already pending!'
+            with transaction.atomic():
+                booking = Booking.objects.select_for_update().get(
+                    id=booking.id
+                )
+                if booking.status == BookingStatus.PENDING:
+                    raise BookingAlreadyPending(
+                        f'Booking {booking.locator} already pending!'
+                    )
+                booking.status = BookingStatus.PENDING
+                booking.save()
+                DjangoAvailabilityRepository.set_slots_booked(
+                    slot_ids=list(booking.slots.values_list('id', flat=True)),
+                    booked=False
+                )
+                transaction.on_commit(
+                    partial(
+                        DjangoBookingsRepository.refresh_days_summaries,
+                        booking
+                    )
                 )
-            booking.status = BookingStatus.PENDING
-            booking.save()
-            for slot in booking.slots.all():
-                slot.booked = False
-                slot.save()
 
         except BoatsAndJoyException as e:
             messages.add_message(request, messages.ERROR, str(e))
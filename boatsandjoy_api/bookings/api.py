@@ -147,7 +147,7 @@ class BookingsApi:
     def send_confirmation_email(booking: Booking):
         if booking.customer_email:
             api_request = FilterBoatsRequest(obj_id=booking.boat_id)
-            results = boats_api.get(api_request)
+            results = boats_api.get(api_request, validate=False)
             send_email(
                 subject='Boats & Joy: Booking confirmation',
                 to_email=booking.customer_email,
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class BookingsConfig(AppConfig):
     name = 'boatsandjoy_api.bookings'
     verbose_name = 'Bookings'
+
+    def ready(self):
+        import stripe
+
+        from .payment_gateways import get_stripe_http_client
+
+        stripe.default_http_client = get_stripe_http_client()
@@ -23,3 +23,11 @@ class BookingAlreadyConfirmed(BookingsApiException):
 
 class BookingAlreadyPending(BookingsApiException):
     pass
+
+
+class BookingSlotsAlreadyBooked(BookingsApiException):
+    pass
+
+
+class PaymentGatewayError(BookingsApiException):
+    pass
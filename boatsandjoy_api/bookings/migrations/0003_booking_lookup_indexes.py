@@ -0,0 +1,42 @@
+# Generated by Django 3.1.5 on 2026-10-17 13:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_booking_extras'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='locator',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='session_id',
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text='Session id',
+                max_length=100,
+            ),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='status',
+            field=models.CharField(
+                choices=[
+                    ('pending', 'Pending'),
+                    ('confirmed', 'Confirmed'),
+                    ('error', 'Error'),
+                ],
+                db_index=True,
+                default='pending',
+                max_length=10,
+            ),
+        ),
+    ]
@@ -5,7 +5,7 @@ from .constants import BookingStatus
 
 
 class Booking(BaseModel):
-    locator = models.CharField(max_length=20)
+    locator = models.CharField(max_length=20, db_index=True)
     price = models.DecimalField(
         blank=False,
         max_digits=8,
@@ -20,10 +20,13 @@ class Booking(BaseModel):
         choices=BookingStatus.STATUS,
         default=BookingStatus.PENDING,
         max_length=10,
+        db_index=True,
     )
     session_id = models.CharField(
         max_length=100,
-        help_text='Session id', blank=True
+        help_text='Session id',
+        blank=True,
+        db_index=True,
     )
     extras = models.TextField(default='')
 
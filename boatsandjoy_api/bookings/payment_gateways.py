@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
 
+import requests
 import stripe
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from stripe.http_client import HTTPClient, RequestsClient
+
+from .exceptions import PaymentGatewayError
 
 
 class PaymentGateway(ABC):
@@ -35,24 +40,27 @@ class StripePaymentGateway(PaymentGateway):
         description: str,
         price: Decimal
     ) -> str:
-        stripe.api_key = settings.STRIPE_SECRET_KEY
-        session = stripe.checkout.Session.create(
-            payment_method_types=['card'],
-            line_items=[
-                {
-                    'name': name,
-                    'description': description,
-                    'amount': cls._format_price(price),
-                    'currency': 'eur',
-                    'quantity': 1,
-                }
-            ],
-            success_url=(
-                settings.STRIPE_REDIRECT_URL
-                + '?session_id={CHECKOUT_SESSION_ID}'
-            ),
-            cancel_url=settings.STRIPE_REDIRECT_URL,
-        )
+        try:
+            session = stripe.checkout.Session.create(
+                api_key=settings.STRIPE_SECRET_KEY,
+                payment_method_types=['card'],
+                line_items=[
+                    {
+                        'name': name,
+                        'description': description,
+                        'amount': cls._format_price(price),
+                        'currency': 'eur',
+                        'quantity': 1,
+                    }
+                ],
+                success_url=(
+                    settings.STRIPE_REDIRECT_URL
+                    + '?session_id={CHECKOUT_SESSION_ID}'
+                ),
+                cancel_url=settings.STRIPE_REDIRECT_URL,
+            )
+        except stripe.error.StripeError as e:
+            raise PaymentGatewayError(f'Payment gateway error: {e}')
         return session.id
 
     @classmethod
@@ -62,10 +70,37 @@ class StripePaymentGateway(PaymentGateway):
     @classmethod
     def get_customer_email_from_event(cls, event: dict) -> str:
         customer_id = event['data']['object']['customer']
-        stripe.api_key = settings.STRIPE_SECRET_KEY
-        customer = stripe.Customer.retrieve(customer_id)
+        try:
+            customer = stripe.Customer.retrieve(
+                customer_id,
+                api_key=settings.STRIPE_SECRET_KEY
+            )
+        except stripe.error.StripeError as e:
+            raise PaymentGatewayError(f'Payment gateway error: {e}')
         return customer['email']
 
     @staticmethod
     def _format_price(price):
         return int(float(price) * 100)
+
+
+def get_stripe_http_client() -> HTTPClient:
+    """
+    HTTP client for all the requests to Stripe of the process. Connections
+    are pooled to be reused between requests and requests fail when Stripe
+    doesn't connect or respond in time
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.STRIPE_HTTP_POOL_SIZE
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return RequestsClient(
+        timeout=(
+            settings.STRIPE_CONNECT_TIMEOUT,
+            settings.STRIPE_READ_TIMEOUT
+        ),
+        session=session,
+    )
@@ -4,15 +4,20 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import List
 
-from django.db import DatabaseError
+from django.db import DatabaseError, transaction
 
-from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.exceptions import SlotsAlreadyBooked
+from boatsandjoy_api.availability.models import Day, Slot
+from boatsandjoy_api.availability.repository import (
+    DjangoAvailabilityRepository,
+)
 from boatsandjoy_api.core.data_adapters import DjangoDataAdapter
 from . import domain, models
 from .constants import BookingStatus
 from .exceptions import (
     BookingInvalidDataError,
     BookingNotFound,
+    BookingSlotsAlreadyBooked,
     NoSlotsSelected,
 )
 
@@ -91,20 +96,27 @@ class DjangoBookingsRepository(BookingsRepository):
             locator=cls._generate_locator(),
             extras=extras,
         )
+        if Slot.objects.filter(id__in=slot_ids, booked=True).exists():
+            raise BookingSlotsAlreadyBooked('Some slots are already booked')
         try:
-            booking = models.Booking.objects.create(**django_data)
-            booking.slots.add(*slot_ids)
+            with transaction.atomic():
+                booking = models.Booking.objects.create(**django_data)
+                booking.slots.add(*slot_ids)
         except DatabaseError as e:
             raise BookingInvalidDataError(str(e))
         return cls.get_booking_domain_object(booking)
 
     @classmethod
     def get_purchase_details(cls, price: Decimal, slot_ids: List[int]) -> dict:
-        slots = Slot.objects.filter(id__in=slot_ids).order_by('position')
+        slots = list(
+            Slot.objects.filter(id__in=slot_ids)
+            .select_related('day__definition__boat')
+            .order_by('position')
+        )
         if not slots:
             raise NoSlotsSelected('A purchase requires slots!')
-        first_slot = slots.first()
-        last_slot = slots.last()
+        first_slot = slots[0]
+        last_slot = slots[-1]
         boat = first_slot.day.definition.boat
         day = first_slot.day.date
         purchase_details = {
@@ -137,13 +149,30 @@ class DjangoBookingsRepository(BookingsRepository):
 
     @classmethod
     def mark_as_paid(cls, booking: domain.Booking) -> domain.Booking:
+        """
+        Confirms the booking and claims its slots in one transaction. The
+        booking row is locked so repeated payment events confirm it once
+
+        :raises BookingSlotsAlreadyBooked: when another booking got any of
+            the slots first, the booking is left as it was
+        """
         try:
-            booking = models.Booking.objects.get(id=booking.id)
-        except models.Booking.DoesNotExist as e:
-            raise BookingNotFound(f'Booking not found: {e}')
-        booking.status = BookingStatus.CONFIRMED
-        booking.save()
-        cls._mark_slots_as_booked(booking)
+            with transaction.atomic():
+                try:
+                    booking = models.Booking.objects.select_for_update().get(
+                        id=booking.id
+                    )
+                except models.Booking.DoesNotExist as e:
+                    raise BookingNotFound(f'Booking not found: {e}')
+                if booking.status != BookingStatus.CONFIRMED:
+                    booking.status = BookingStatus.CONFIRMED
+                    booking.save()
+                    cls._claim_slots(booking)
+        except SlotsAlreadyBooked as e:
+            raise BookingSlotsAlreadyBooked(
+                f'Booking {booking.locator} slots already booked: {e}'
+            )
+        cls.refresh_days_summaries(booking)
         return cls.get_booking_domain_object(booking)
 
     @classmethod
@@ -179,8 +208,13 @@ class DjangoBookingsRepository(BookingsRepository):
         cls,
         booking: models.Booking
     ) -> domain.Booking:
-        slots = booking.slots.order_by('position')
-        boat = slots.first().day.definition.boat
+        slots = list(
+            booking.slots.select_related('day__definition__boat').order_by(
+                'position'
+            )
+        )
+        first_slot = slots[0]
+        boat = first_slot.day.definition.boat
         return domain.Booking(
             id=booking.id,
             locator=booking.locator,
@@ -190,10 +224,10 @@ class DjangoBookingsRepository(BookingsRepository):
             session_id=booking.session_id,
             boat_id=boat.id,
             boat_name=boat.name,
-            slot_ids=list(slots.values_list('id', flat=True)),
-            date=slots.first().day.date,
-            checkin_hour=slots.first().from_hour,
-            checkout_hour=slots.last().to_hour,
+            slot_ids=[slot.id for slot in slots],
+            date=first_slot.day.date,
+            checkin_hour=first_slot.from_hour,
+            checkout_hour=slots[-1].to_hour,
             customer_email=booking.customer_email,
             customer_name=booking.customer_name,
             customer_telephone_number=booking.customer_telephone_number,
@@ -201,10 +235,24 @@ class DjangoBookingsRepository(BookingsRepository):
         )
 
     @staticmethod
-    def _mark_slots_as_booked(booking: models.Booking):
-        for slot in booking.slots.all():
-            slot.booked = True
-            slot.save()
+    def refresh_days_summaries(booking: models.Booking):
+        boats_dates = (
+            Day.objects.filter(slots__booking=booking)
+            .values_list('definition__boat_id', 'date')
+            .distinct()
+        )
+        for boat_id, date_ in boats_dates:
+            DjangoAvailabilityRepository.refresh_days_summaries(
+                boat_id=boat_id,
+                from_=date_,
+                to=date_
+            )
+
+    @staticmethod
+    def _claim_slots(booking: models.Booking):
+        DjangoAvailabilityRepository.claim_slots(
+            slot_ids=list(booking.slots.values_list('id', flat=True))
+        )
 
     @staticmethod
     def _generate_locator(length=20):
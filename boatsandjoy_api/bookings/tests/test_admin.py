@@ -0,0 +1,89 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, TransactionTestCase
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.constants import DayAvailabilityTypes
+from boatsandjoy_api.availability.models import DaySummary, Slot
+from boatsandjoy_api.availability.tests.utils import (
+    create_boat,
+    create_day_definition,
+)
+from boatsandjoy_api.bookings.admin import unconfirm_booking
+from boatsandjoy_api.bookings.constants import BookingStatus
+from boatsandjoy_api.bookings.exceptions import BookingSlotsAlreadyBooked
+from boatsandjoy_api.bookings.models import Booking
+from boatsandjoy_api.bookings.repository import DjangoBookingsRepository
+
+
+class BookingSlotsTestCase(TransactionTestCase):
+    def setUp(self):
+        self.boat = create_boat()
+        create_day_definition(self.boat)
+        AvailabilityGenerator(self.boat).generate(2027)
+        self.date = date(2027, 6, 1)
+        self.slot_ids = list(
+            Slot.objects.filter(day__date=self.date)
+            .order_by('position')
+            .values_list('id', flat=True)[:2]
+        )
+
+    def test_second_booking_of_same_slot_is_refused(self):
+        first_booking = self._create_booking(self.slot_ids)
+        second_booking = self._create_booking(self.slot_ids[1:])
+
+        DjangoBookingsRepository.mark_as_paid(first_booking)
+        with self.assertRaises(BookingSlotsAlreadyBooked):
+            DjangoBookingsRepository.mark_as_paid(second_booking)
+
+        self.assertEqual(
+            Booking.objects.get(id=second_booking.id).status,
+            BookingStatus.PENDING
+        )
+        self.assertEqual(
+            Slot.objects.filter(id__in=self.slot_ids, booked=True).count(),
+            2
+        )
+
+    def test_unconfirm_booking_frees_its_slots(self):
+        booking = DjangoBookingsRepository.mark_as_paid(
+            self._create_booking(self.slot_ids)
+        )
+        self.assertEqual(self._get_day_summary().booked_slots, 2)
+
+        request = RequestFactory().post('/')
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        unconfirm_booking(None, request, Booking.objects.filter(id=booking.id))
+
+        self.assertEqual(
+            Booking.objects.get(id=booking.id).status,
+            BookingStatus.PENDING
+        )
+        self.assertFalse(
+            Slot.objects.filter(id__in=self.slot_ids, booked=True).exists()
+        )
+        day_summary = self._get_day_summary()
+        self.assertEqual(day_summary.booked_slots, 0)
+        self.assertEqual(
+            day_summary.availability_type,
+            DayAvailabilityTypes.FREE
+        )
+
+    def _create_booking(self, slot_ids):
+        return DjangoBookingsRepository.create(
+            price=Decimal('49.40'),
+            slot_ids=slot_ids,
+            customer_name='Customer',
+            customer_telephone_number='600000000',
+            customer_email='customer@example.com',
+            session_id='',
+            extras=''
+        )
+
+    def _get_day_summary(self):
+        return DaySummary.objects.get(boat=self.boat, date=self.date)
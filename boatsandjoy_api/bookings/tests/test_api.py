@@ -0,0 +1,230 @@
+from contextlib import contextmanager
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.tests.utils import (
+    create_boat,
+    create_day_definition,
+)
+from boatsandjoy_api.bookings.api import BookingsApi
+from boatsandjoy_api.bookings.constants import BookingStatus
+from boatsandjoy_api.bookings.models import Booking
+from boatsandjoy_api.bookings.repository import DjangoBookingsRepository
+from boatsandjoy_api.bookings.requests import (
+    CreateBookingRequest,
+    GetBookingBySessionRequest,
+    GetBookingRequest,
+    MarkBookingAsErrorRequest,
+    RegisterBookingEventRequest,
+)
+from boatsandjoy_api.bookings.tests.utils import (
+    FailingPaymentGateway,
+    StubPaymentGateway,
+    get_payment_event,
+)
+from boatsandjoy_api.core.responses import (
+    ErrorResponseBuilder,
+    ResponseBuilder,
+)
+
+TRANSACTION_STATEMENTS = ('BEGIN', 'SAVEPOINT', 'RELEASE SAVEPOINT')
+
+api = BookingsApi(
+    DjangoBookingsRepository,
+    ResponseBuilder,
+    ErrorResponseBuilder,
+    StubPaymentGateway,
+)
+failing_api = BookingsApi(
+    DjangoBookingsRepository,
+    ResponseBuilder,
+    ErrorResponseBuilder,
+    FailingPaymentGateway,
+)
+
+
+class BookingsApiTestCase(TransactionTestCase):
+    def setUp(self):
+        boat = create_boat()
+        create_day_definition(boat)
+        AvailabilityGenerator(boat).generate(2027)
+        self.slot_ids = list(
+            Slot.objects.filter(day__date='2027-06-01')
+            .order_by('position')
+            .values_list('id', flat=True)[:3]
+        )
+
+    @contextmanager
+    def assertNumDataQueries(self, num: int):
+        """
+        Like assertNumQueries but not counting transaction statements,
+        SQLite logs BEGIN and PostgreSQL doesn't
+        """
+        with CaptureQueriesContext(connection) as context:
+            yield
+        queries = [
+            query['sql']
+            for query in context.captured_queries
+            if not query['sql'].startswith(TRANSACTION_STATEMENTS)
+        ]
+        self.assertEqual(
+            len(queries),
+            num,
+            '\n'.join([f'{len(queries)} queries executed:', *queries])
+        )
+
+    def create_booking(self, bookings_api: BookingsApi = api) -> dict:
+        return bookings_api.create(
+            CreateBookingRequest(
+                price=Decimal('74.10'),
+                slot_ids=self.slot_ids,
+                customer_name='Customer',
+                customer_telephone_number='600000000',
+                extras='',
+            )
+        )
+
+
+@mock.patch('boatsandjoy_api.bookings.api.send_email')
+class BookingsApiQueriesTestCase(BookingsApiTestCase):
+    def test_create(self, send_email):
+        with self.assertNumDataQueries(5):
+            results = self.create_booking()
+
+        self.assertFalse(results['error'])
+        self.assertTrue(results['data']['session_id'].startswith('cs_test_'))
+
+    def test_get(self, send_email):
+        booking_id = self.create_booking()['data']['id']
+
+        with self.assertNumDataQueries(2):
+            results = api.get(
+                GetBookingRequest(
+                    obj_id=booking_id,
+                    generate_new_session_id=False
+                )
+            )
+
+        self.assertFalse(results['error'])
+        self.assertEqual(results['data']['id'], booking_id)
+
+    def test_get_with_new_session_id(self, send_email):
+        booking_id = self.create_booking()['data']['id']
+
+        with self.assertNumDataQueries(6):
+            results = api.get(
+                GetBookingRequest(
+                    obj_id=booking_id,
+                    generate_new_session_id=True
+                )
+            )
+
+        self.assertFalse(results['error'])
+        self.assertEqual(
+            Booking.objects.get(id=booking_id).session_id,
+            results['data']['session_id']
+        )
+
+    def test_get_booking_by_session(self, send_email):
+        booking = self.create_booking()['data']
+        booking_id = booking['id']
+
+        with self.assertNumDataQueries(2):
+            results = api.get_booking_by_session(
+                GetBookingBySessionRequest(session_id=booking['session_id'])
+            )
+
+        self.assertFalse(results['error'])
+        self.assertEqual(results['data']['id'], booking_id)
+
+    def test_register_event(self, send_email):
+        booking = self.create_booking()['data']
+        booking_id = booking['id']
+        event = get_payment_event(
+            session_id=booking['session_id'],
+            customer_email='customer@example.com'
+        )
+
+        with self.assertNumDataQueries(17):
+            results = api.register_event(
+                RegisterBookingEventRequest(headers={}, body=event)
+            )
+
+        self.assertFalse(results['error'])
+        booking = Booking.objects.get(id=booking_id)
+        self.assertEqual(booking.status, BookingStatus.CONFIRMED)
+        self.assertEqual(booking.customer_email, 'customer@example.com')
+        self.assertEqual(send_email.call_count, 2)
+
+    def test_mark_as_error(self, send_email):
+        booking = self.create_booking()['data']
+        booking_id = booking['id']
+
+        with self.assertNumDataQueries(5):
+            results = api.mark_as_error(
+                MarkBookingAsErrorRequest(session_id=booking['session_id'])
+            )
+
+        self.assertFalse(results['error'])
+        self.assertEqual(
+            Booking.objects.get(id=booking_id).status,
+            BookingStatus.ERROR
+        )
+
+
+class BookingsApiPaymentGatewayErrorsTestCase(BookingsApiTestCase):
+    def test_create(self):
+        results = self.create_booking(failing_api)
+
+        self.assertEqual(
+            results,
+            {
+                'error': True,
+                'data': (
+                    'Payment gateway error: '
+                    f'{FailingPaymentGateway.ERROR}'
+                ),
+            }
+        )
+        self.assertFalse(Booking.objects.exists())
+
+    def test_get_with_new_session_id(self):
+        booking = self.create_booking()['data']
+
+        results = failing_api.get(
+            GetBookingRequest(
+                obj_id=booking['id'],
+                generate_new_session_id=True
+            )
+        )
+
+        self.assertTrue(results['error'])
+        self.assertEqual(
+            Booking.objects.get(id=booking['id']).session_id,
+            booking['session_id']
+        )
+
+    def test_register_event(self):
+        booking = self.create_booking()['data']
+        event = get_payment_event(
+            session_id=booking['session_id'],
+            customer_email='customer@example.com'
+        )
+
+        results = failing_api.register_event(
+            RegisterBookingEventRequest(headers={}, body=event)
+        )
+
+        self.assertTrue(results['error'])
+        self.assertEqual(
+            Booking.objects.get(id=booking['id']).status,
+            BookingStatus.PENDING
+        )
@@ -0,0 +1,151 @@
+import json
+from unittest import mock
+
+from django.test import AsyncClient, TransactionTestCase, override_settings
+from django.urls import path
+
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.tests.utils import (
+    create_boat,
+    create_day_definition,
+)
+from boatsandjoy_api.bookings.api import BookingsApi
+from boatsandjoy_api.bookings.repository import DjangoBookingsRepository
+from boatsandjoy_api.bookings.tests.utils import (
+    FailingPaymentGateway,
+    StubPaymentGateway,
+)
+from boatsandjoy_api.bookings.views import (
+    async_create_booking,
+    async_generate_payment,
+)
+from boatsandjoy_api.core.responses import (
+    ErrorResponseBuilder,
+    ResponseBuilder,
+)
+
+# The bookings urls only route to the async views with BOOKINGS_ASYNC_VIEWS
+urlpatterns = [
+    path(r'generate/payment/', async_generate_payment),
+    path(r'create/booking/', async_create_booking),
+]
+
+
+# The api runs in the thread pool with its own database connections, so data
+# must be committed to be seen by it
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncBookingsViewsTestCase(TransactionTestCase):
+    def setUp(self):
+        boat = create_boat()
+        create_day_definition(boat)
+        AvailabilityGenerator(boat).generate(2027)
+        self.slot_ids = list(
+            Slot.objects.filter(day__date='2027-06-01')
+            .order_by('position')
+            .values_list('id', flat=True)[:3]
+        )
+        self.client = AsyncClient()
+
+    def use_payment_gateway(self, payment_gateway):
+        patcher = mock.patch(
+            'boatsandjoy_api.bookings.views.bookings_api',
+            BookingsApi(
+                DjangoBookingsRepository,
+                ResponseBuilder,
+                ErrorResponseBuilder,
+                payment_gateway,
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def create_booking(self) -> dict:
+        response = await self.client.post(
+            '/create/booking/',
+            {
+                'price': '74.10',
+                'slot_ids': ','.join(map(str, self.slot_ids)),
+                'customer_name': 'Customer',
+                'customer_telephone_number': '600000000',
+                'extras': '',
+            },
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return json.loads(response.content)
+
+    async def test_create_booking(self):
+        self.use_payment_gateway(StubPaymentGateway)
+
+        results = await self.create_booking()
+
+        self.assertFalse(results['error'])
+        self.assertTrue(results['data']['session_id'].startswith('cs_test_'))
+
+    async def test_create_booking_payment_gateway_error(self):
+        self.use_payment_gateway(FailingPaymentGateway)
+
+        results = await self.create_booking()
+
+        self.assertEqual(
+            results,
+            {
+                'error': True,
+                'data': (
+                    'Payment gateway error: '
+                    f'{FailingPaymentGateway.ERROR}'
+                ),
+            }
+        )
+
+    async def test_create_booking_not_allowed_method(self):
+        response = await self.client.get('/create/booking/')
+
+        self.assertEqual(response.status_code, 405)
+
+    async def test_generate_payment(self):
+        self.use_payment_gateway(StubPaymentGateway)
+        booking = (await self.create_booking())['data']
+
+        response = await self.client.get(
+            f'/generate/payment/?booking_id={booking["id"]}'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(response.content)
+        self.assertFalse(results['error'])
+        self.assertEqual(results['data']['id'], booking['id'])
+        self.assertNotEqual(
+            results['data']['session_id'],
+            booking['session_id']
+        )
+
+    async def test_generate_payment_payment_gateway_error(self):
+        self.use_payment_gateway(StubPaymentGateway)
+        booking = (await self.create_booking())['data']
+        self.use_payment_gateway(FailingPaymentGateway)
+
+        response = await self.client.get(
+            f'/generate/payment/?booking_id={booking["id"]}'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                'error': True,
+                'data': (
+                    'Payment gateway error: '
+                    f'{FailingPaymentGateway.ERROR}'
+                ),
+            }
+        )
+
+    async def test_generate_payment_not_allowed_method(self):
+        response = await self.client.post('/generate/payment/')
+
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,51 @@
+from decimal import Decimal
+from itertools import count
+
+from boatsandjoy_api.bookings.exceptions import PaymentGatewayError
+from boatsandjoy_api.bookings.payment_gateways import PaymentGateway
+
+
+class StubPaymentGateway(PaymentGateway):
+    """
+    Local payment gateway that doesn't call any payment platform. Checkout
+    sessions ids are numbered and events have the Stripe shape, with the
+    customer email instead of the customer id. It fails with ERROR when set
+    """
+
+    ERROR = None
+
+    _sessions_ids = count(1)
+
+    @classmethod
+    def generate_checkout_session_id(
+        cls,
+        name: str,
+        description: str,
+        price: Decimal
+    ) -> str:
+        if cls.ERROR:
+            raise PaymentGatewayError(f'Payment gateway error: {cls.ERROR}')
+        return f'cs_test_{next(cls._sessions_ids)}'
+
+    @classmethod
+    def get_session_id_from_event(cls, event: dict) -> str:
+        return event['data']['object']['id']
+
+    @classmethod
+    def get_customer_email_from_event(cls, event: dict) -> str:
+        if cls.ERROR:
+            raise PaymentGatewayError(f'Payment gateway error: {cls.ERROR}')
+        return event['data']['object']['customer_email']
+
+
+class FailingPaymentGateway(StubPaymentGateway):
+    ERROR = 'Connection to the payment platform timed out'
+
+
+def get_payment_event(session_id: str, customer_email: str) -> dict:
+    return {
+        'type': 'checkout.session.completed',
+        'data': {
+            'object': {'id': session_id, 'customer_email': customer_email}
+        },
+    }
@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import (
+    async_create_booking,
+    async_generate_payment,
     create_booking,
     generate_payment,
     mark_booking_as_error,
@@ -11,8 +14,24 @@ from .views import (
 app_name = 'bookings'
 
 urlpatterns = [
-    path(r'generate/payment/', generate_payment, name='generate-payment'),
-    path(r'create/booking/', create_booking, name='create-booking'),
+    path(
+        r'generate/payment/',
+        (
+            async_generate_payment
+            if settings.BOOKINGS_ASYNC_VIEWS
+            else generate_payment
+        ),
+        name='generate-payment',
+    ),
+    path(
+        r'create/booking/',
+        (
+            async_create_booking
+            if settings.BOOKINGS_ASYNC_VIEWS
+            else create_booking
+        ),
+        name='create-booking',
+    ),
     path(
         r'register/booking/event/',
         register_booking_event,
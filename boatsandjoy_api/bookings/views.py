@@ -1,10 +1,13 @@
 import json
 
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from boatsandjoy_api.bookings.api import api as bookings_api
+from boatsandjoy_api.core.responses import json_response
+from boatsandjoy_api.core.utils import run_in_thread_pool
 from boatsandjoy_api.bookings.requests import (
     CreateBookingRequest,
     GetBookingRequest,
@@ -16,11 +19,7 @@ from boatsandjoy_api.bookings.requests import (
 
 @api_view(['GET'])
 def generate_payment(request: Request) -> Response:
-    api_request = GetBookingRequest(
-        obj_id=request.GET['booking_id'],
-        generate_new_session_id=True
-    )
-    results = bookings_api.get(api_request)
+    results = bookings_api.get(get_generate_payment_request(request))
     return Response(results)
 
 
@@ -40,15 +39,7 @@ def create_booking(request: Request) -> Response:
         }
     }
     """
-    data = json.loads(request.body)
-    api_request = CreateBookingRequest(
-        price=data['price'],
-        slot_ids=[int(slot_id) for slot_id in data['slot_ids'].split(',')],
-        customer_name=data['customer_name'],
-        customer_telephone_number=data['customer_telephone_number'],
-        extras=data['extras'],
-    )
-    results = bookings_api.create(api_request)
+    results = bookings_api.create(get_create_booking_request(request))
     return Response(results)
 
 
@@ -80,3 +71,55 @@ def get_booking_by_session(request: Request) -> Response:
     api_request = GetBookingBySessionRequest(session_id=session_id)
     results = bookings_api.get_booking_by_session(api_request)
     return Response(results)
+
+
+async def async_generate_payment(request: HttpRequest) -> HttpResponse:
+    """
+    ASGI variant of generate_payment that doesn't block the event loop
+    while the checkout session is created
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    results = await run_in_thread_pool(
+        bookings_api.get,
+        get_generate_payment_request(request)
+    )
+    return json_response(results)
+
+
+async def async_create_booking(request: HttpRequest) -> HttpResponse:
+    """
+    ASGI variant of create_booking that doesn't block the event loop while
+    the checkout session is created
+    """
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+    results = await run_in_thread_pool(
+        bookings_api.create,
+        get_create_booking_request(request)
+    )
+    return json_response(results)
+
+
+# As DRF views, they don't require the CSRF token. csrf_exempt can't
+# decorate coroutines in this Django version
+async_generate_payment.csrf_exempt = True
+async_create_booking.csrf_exempt = True
+
+
+def get_generate_payment_request(request: HttpRequest) -> GetBookingRequest:
+    return GetBookingRequest(
+        obj_id=request.GET['booking_id'],
+        generate_new_session_id=True
+    )
+
+
+def get_create_booking_request(request: HttpRequest) -> CreateBookingRequest:
+    data = json.loads(request.body)
+    return CreateBookingRequest(
+        price=data['price'],
+        slot_ids=[int(slot_id) for slot_id in data['slot_ids'].split(',')],
+        customer_name=data['customer_name'],
+        customer_telephone_number=data['customer_telephone_number'],
+        extras=data['extras'],
+    )
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from time import monotonic
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def incr_cache_version(key: str):
+    """
+    Bumps a version stored without expiration in the default cache
+    """
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key evicted between add and incr
+        cache.set(key, 1, None)
+
+
+def invalidate_on_commit(invalidate: Callable[[], None]):
+    """
+    Invalidates once the current transaction is committed, before that
+    other processes could reload the data without the change
+    """
+    transaction.on_commit(invalidate)
+
+
+class VersionedSnapshot(ABC):
+    """
+    Process local snapshot shared by every request. It is reloaded when it
+    is older than the TIMEOUT_SETTING seconds or when the version stored
+    in the shared cache under VERSION_KEY changes, invalidate bumps it.
+    The snapshot must not be modified
+    """
+
+    VERSION_KEY = None
+    TIMEOUT_SETTING = None
+
+    _version = None
+    _loaded_at = None
+    _snapshot = None
+
+    @classmethod
+    def get(cls):
+        version = cache.get(cls.VERSION_KEY, 0)
+        if (
+            cls._snapshot is None
+            or version != cls._version
+            or monotonic() - cls._loaded_at
+            > getattr(settings, cls.TIMEOUT_SETTING)
+        ):
+            cls._snapshot = cls._load()
+            cls._version = version
+            cls._loaded_at = monotonic()
+        return cls._snapshot
+
+    @classmethod
+    def invalidate(cls):
+        incr_cache_version(cls.VERSION_KEY)
+
+    @classmethod
+    @abstractmethod
+    def _load(cls):
+        pass
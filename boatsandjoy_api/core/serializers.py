@@ -0,0 +1,80 @@
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import (
+    Callable,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+
+def serialize(obj: any) -> any:
+    """
+    Dataclasses are serialized into dicts of its fields following the plan
+    compiled for its class, dicts and values of other types are returned
+    as they are. Serialized objects are never modified
+    """
+    return get_serializer(type(obj))(obj)
+
+
+@lru_cache(maxsize=None)
+def get_serializer(cls: type) -> Callable:
+    if is_dataclass(cls):
+        return _compile_dataclass_serializer(cls)
+    if cls in (list, tuple):
+        return _serialize_list
+    return _serialize_value
+
+
+def _compile_dataclass_serializer(cls: type) -> Callable:
+    type_hints = get_type_hints(cls)
+    plan = tuple(
+        (field.name, _get_field_serializer(type_hints[field.name]))
+        for field in fields(cls)
+    )
+
+    def serialize_dataclass(obj) -> dict:
+        return {
+            name: (
+                getattr(obj, name)
+                if field_serializer is None
+                else field_serializer(getattr(obj, name))
+            )
+            for name, field_serializer in plan
+        }
+
+    return serialize_dataclass
+
+
+def _get_field_serializer(type_hint: any) -> Optional[Callable]:
+    """
+    Only fields that can hold dataclasses need to be serialized, the rest
+    of values are copied as they are
+    """
+    origin = get_origin(type_hint)
+    if origin is Union:
+        args = [arg for arg in get_args(type_hint) if arg is not type(None)]
+        if len(args) == 1:
+            return _get_field_serializer(args[0])
+        return serialize
+    if is_dataclass(type_hint):
+        return _serialize_optional
+    if origin in (list, tuple) and any(map(is_dataclass, get_args(type_hint))):
+        return _serialize_optional
+    return None
+
+
+def _serialize_optional(value: any) -> any:
+    return None if value is None else serialize(value)
+
+
+def _serialize_list(values: Union[list, tuple]) -> list:
+    return [serialize(value) for value in values]
+
+
+def _serialize_value(value: any) -> any:
+    if isinstance(value, dict) or not hasattr(value, '__dict__'):
+        return value
+    return dict(vars(value))
@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from boatsandjoy_api.core.caches import VersionedSnapshot, incr_cache_version
+
+
+class NumbersSnapshot(VersionedSnapshot):
+    VERSION_KEY = 'tests:numbers:version'
+    TIMEOUT_SETTING = 'NUMBERS_TIMEOUT'
+
+    loads = 0
+
+    @classmethod
+    def _load(cls) -> tuple:
+        cls.loads += 1
+        return (1, 2, 3)
+
+
+@override_settings(NUMBERS_TIMEOUT=60)
+class VersionedSnapshotTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.delete(NumbersSnapshot.VERSION_KEY)
+        NumbersSnapshot._snapshot = None
+        NumbersSnapshot.loads = 0
+
+    def test_reused_until_invalidated(self):
+        self.assertEqual(NumbersSnapshot.get(), (1, 2, 3))
+        self.assertEqual(NumbersSnapshot.get(), (1, 2, 3))
+        self.assertEqual(NumbersSnapshot.loads, 1)
+
+        NumbersSnapshot.invalidate()
+
+        self.assertEqual(NumbersSnapshot.get(), (1, 2, 3))
+        self.assertEqual(NumbersSnapshot.loads, 2)
+
+    def test_reloaded_when_expired(self):
+        NumbersSnapshot.get()
+
+        with mock.patch(
+            'boatsandjoy_api.core.caches.monotonic',
+            return_value=NumbersSnapshot._loaded_at + 61
+        ):
+            NumbersSnapshot.get()
+
+        self.assertEqual(NumbersSnapshot.loads, 2)
+
+    def test_version_evicted(self):
+        NumbersSnapshot.invalidate()
+        NumbersSnapshot.get()
+        cache.delete(NumbersSnapshot.VERSION_KEY)
+
+        NumbersSnapshot.get()
+
+        self.assertEqual(NumbersSnapshot.loads, 2)
+
+
+class IncrCacheVersionTestCase(SimpleTestCase):
+    KEY = 'tests:version'
+
+    def setUp(self):
+        cache.delete(self.KEY)
+
+    def test_incr(self):
+        incr_cache_version(self.KEY)
+        incr_cache_version(self.KEY)
+
+        self.assertEqual(cache.get(self.KEY), 2)
+
+    def test_evicted_between_add_and_incr(self):
+        with mock.patch.object(cache, 'add'):
+            incr_cache_version(self.KEY)
+
+        self.assertEqual(cache.get(self.KEY), 1)
@@ -0,0 +1,175 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest import skipIf
+from uuid import UUID
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+
+from boatsandjoy_api.availability.api import api as availability_api
+from boatsandjoy_api.availability.availability_generators import (
+    AvailabilityGenerator,
+)
+from boatsandjoy_api.availability.caches import DjangoDayAvailabilityCache
+from boatsandjoy_api.availability.indexes import DjangoBoatsIntervalIndexes
+from boatsandjoy_api.availability.models import Slot
+from boatsandjoy_api.availability.requests import (
+    GetDayAvailabilityRequest,
+    GetMonthAvailabilityRequest,
+)
+from boatsandjoy_api.availability.tests.utils import (
+    create_boat,
+    create_day_definition,
+    create_price_variation,
+)
+from boatsandjoy_api.boats.caches import DjangoActiveBoatsCache
+from boatsandjoy_api.bookings.api import api as bookings_api
+from boatsandjoy_api.bookings.repository import DjangoBookingsRepository
+from boatsandjoy_api.bookings.requests import GetBookingRequest
+from boatsandjoy_api.core.renderers import FastJSONRenderer, orjson
+
+
+class SameRenderingMixin:
+    def assert_same_rendering(self, data):
+        self.assertEqual(
+            FastJSONRenderer().render(data),
+            JSONRenderer().render(data)
+        )
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTestCase(SameRenderingMixin, SimpleTestCase):
+
+    def test_day_availability_response(self):
+        self.assert_same_rendering(
+            {
+                'error': False,
+                'data': [
+                    {
+                        'boat': {'id': 1, 'name': 'Llaüt Marès'},
+                        'availability': [
+                            {
+                                'day': date(2027, 3, 12),
+                                'slots': [
+                                    {
+                                        'id': 281,
+                                        'position': 0,
+                                        'from_hour': time(9),
+                                        'to_hour': time(11, 30),
+                                    }
+                                ],
+                                'price': Decimal('33.84'),
+                                'from_hour': time(9),
+                                'to_hour': time(11, 30),
+                            }
+                        ],
+                    }
+                ],
+            }
+        )
+
+    def test_month_availability_response(self):
+        self.assert_same_rendering(
+            {
+                'error': False,
+                'data': [
+                    {'date': date(2027, 3, day), 'availability': 'FREE'}
+                    for day in range(1, 32)
+                ],
+            }
+        )
+
+    def test_booking_response(self):
+        self.assert_same_rendering(
+            {
+                'error': False,
+                'data': {
+                    'id': 7,
+                    'locator': 'A1B2C3D4E5F6G7H8I9J0',
+                    'created': datetime(
+                        2027, 3, 1, 10, 5, 7, 123456, tzinfo=timezone.utc
+                    ),
+                    'price': Decimal('120.00'),
+                    'session_id': UUID('12345678123456781234567812345678'),
+                    'duration': timedelta(hours=2),
+                    'extras': 'Line\u2028separator and emoji \U0001f6a4',
+                    'slot_ids': (281, 282),
+                    'rate': 0.1,
+                },
+            }
+        )
+
+    def test_error_response(self):
+        self.assert_same_rendering({'error': True, 'data': 'Error: \'x\''})
+
+    def test_not_string_keys(self):
+        self.assert_same_rendering({1: 'one', 2: {3: Decimal('1.5')}})
+
+    def test_date_keys_raise_like_drf(self):
+        data = {date(2027, 3, 12): 'FREE'}
+
+        with self.assertRaises(TypeError):
+            JSONRenderer().render(data)
+        with self.assertRaises(TypeError):
+            FastJSONRenderer().render(data)
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererApiResponsesTestCase(SameRenderingMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        boat = create_boat(name='Llaüt')
+        create_day_definition(boat)
+        create_price_variation(boat)
+        AvailabilityGenerator(boat).generate(2027)
+        slot_ids = list(
+            Slot.objects.filter(day__date=date(2027, 3, 12))
+            .order_by('position')
+            .values_list('id', flat=True)[:2]
+        )
+        cls.booking = DjangoBookingsRepository.create(
+            price=Decimal('41.46'),
+            slot_ids=slot_ids,
+            customer_name='Customer',
+            customer_telephone_number='600000000',
+            customer_email='customer@example.com',
+            session_id='cs_test_session',
+            extras='Life jackets for kids\u2028and a cooler',
+        )
+
+    def setUp(self):
+        # Changes invalidate them on commit, which never happens in TestCase
+        DjangoActiveBoatsCache.invalidate()
+        DjangoBoatsIntervalIndexes.invalidate()
+        DjangoDayAvailabilityCache.invalidate_all()
+
+    def test_day_availability(self):
+        for apply_resident_discount in (False, True):
+            results = availability_api.get_day_availability(
+                GetDayAvailabilityRequest(
+                    date=date(2027, 3, 12),
+                    apply_resident_discount=apply_resident_discount,
+                )
+            )
+
+            self.assertTrue(results['data'])
+            self.assert_same_rendering(results)
+
+    def test_month_availability(self):
+        results = availability_api.get_month_availability(
+            GetMonthAvailabilityRequest(month=3, year=2027)
+        )
+
+        self.assertTrue(results['data'])
+        self.assert_same_rendering(results)
+
+    def test_booking(self):
+        results = bookings_api.get(
+            GetBookingRequest(
+                obj_id=self.booking.id,
+                generate_new_session_id=False
+            )
+        )
+
+        self.assertFalse(results['error'])
+        self.assert_same_rendering(results)
@@ -0,0 +1,212 @@
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from boatsandjoy_api.availability.requests import (
+    GetDayAvailabilityRequest,
+    GetMonthAvailabilityRequest,
+    GetRangeAvailabilityRequest,
+)
+from boatsandjoy_api.availability.validators import (
+    GetAvailabilityRequestValidator,
+    GetMonthAvailabilityRequestValidator,
+    GetRangeAvailabilityRequestValidator,
+)
+from boatsandjoy_api.boats.requests import FilterBoatsRequest
+from boatsandjoy_api.boats.validators import FilterBoatsRequestValidator
+from boatsandjoy_api.bookings.requests import (
+    CreateBookingRequest,
+    GetBookingBySessionRequest,
+    GetBookingRequest,
+)
+from boatsandjoy_api.bookings.validators import (
+    BookingCreationRequestValidator,
+    GetBookingBySessionRequestValidator,
+    GetBookingRequestValidator,
+)
+from boatsandjoy_api.core.exceptions import InvalidDataError
+from boatsandjoy_api.core.validators import compile_request_validator
+
+
+def create_booking_request(**kwargs) -> CreateBookingRequest:
+    fields = {
+        'price': Decimal('74.10'),
+        'slot_ids': [1, 2, 3],
+        'customer_name': 'Customer',
+        'customer_telephone_number': '600000000',
+        'extras': '',
+    }
+    fields.update(kwargs)
+    return CreateBookingRequest(**fields)
+
+
+# Requests with the types the api builds, which the compiled validators
+# accept without the forms
+VALID_REQUESTS = (
+    (
+        GetAvailabilityRequestValidator,
+        GetDayAvailabilityRequest(date(2027, 3, 12), False),
+    ),
+    (
+        GetAvailabilityRequestValidator,
+        GetDayAvailabilityRequest(date(2027, 3, 12), True),
+    ),
+    (
+        GetMonthAvailabilityRequestValidator,
+        GetMonthAvailabilityRequest(3, 2027),
+    ),
+    (BookingCreationRequestValidator, create_booking_request()),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(extras='Life jackets for kids'),
+    ),
+    (BookingCreationRequestValidator, create_booking_request(extras=None)),
+    (GetBookingRequestValidator, GetBookingRequest(7, True)),
+    (GetBookingBySessionRequestValidator, GetBookingBySessionRequest('cs_1')),
+    (FilterBoatsRequestValidator, FilterBoatsRequest()),
+    (FilterBoatsRequestValidator, FilterBoatsRequest(name='Llaüt')),
+    (FilterBoatsRequestValidator, FilterBoatsRequest(active=True)),
+    (FilterBoatsRequestValidator, FilterBoatsRequest(active=False)),
+)
+
+# Requests left to the forms, accepted or rejected by them
+OTHER_REQUESTS = (
+    (
+        GetAvailabilityRequestValidator,
+        GetDayAvailabilityRequest('2027-03-12', False),
+    ),
+    (
+        GetAvailabilityRequestValidator,
+        GetDayAvailabilityRequest('2027-03-12', None),
+    ),
+    (GetAvailabilityRequestValidator, GetDayAvailabilityRequest(None, False)),
+    (
+        GetAvailabilityRequestValidator,
+        GetDayAvailabilityRequest('2027-02-30', False),
+    ),
+    (
+        GetRangeAvailabilityRequestValidator,
+        GetRangeAvailabilityRequest(
+            date(2027, 3, 1),
+            date(2027, 3, 14),
+            False
+        ),
+    ),
+    (
+        GetRangeAvailabilityRequestValidator,
+        GetRangeAvailabilityRequest(
+            date(2027, 3, 14),
+            date(2027, 3, 1),
+            False
+        ),
+    ),
+    (
+        GetMonthAvailabilityRequestValidator,
+        GetMonthAvailabilityRequest('3', 2027),
+    ),
+    (
+        GetMonthAvailabilityRequestValidator,
+        GetMonthAvailabilityRequest(None, 2027),
+    ),
+    (
+        GetMonthAvailabilityRequestValidator,
+        GetMonthAvailabilityRequest(True, 2027),
+    ),
+    (
+        GetMonthAvailabilityRequestValidator,
+        GetMonthAvailabilityRequest(3.5, 2027),
+    ),
+    (BookingCreationRequestValidator, create_booking_request(price='74.10')),
+    (BookingCreationRequestValidator, create_booking_request(price=None)),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(price=Decimal('NaN')),
+    ),
+    (BookingCreationRequestValidator, create_booking_request(slot_ids=[])),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(slot_ids=['1', '2']),
+    ),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(slot_ids=[1, 'two']),
+    ),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(customer_name='  '),
+    ),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(customer_name='Cus\x00tomer'),
+    ),
+    (
+        BookingCreationRequestValidator,
+        create_booking_request(customer_telephone_number=600000000),
+    ),
+    (GetBookingRequestValidator, GetBookingRequest('7', True)),
+    (GetBookingRequestValidator, GetBookingRequest(None, True)),
+    (GetBookingRequestValidator, GetBookingRequest(True, True)),
+    (GetBookingBySessionRequestValidator, GetBookingBySessionRequest('')),
+    (GetBookingBySessionRequestValidator, GetBookingBySessionRequest(None)),
+    (FilterBoatsRequestValidator, FilterBoatsRequest(active='yes')),
+)
+
+
+class RequestValidatorsTestCase(SimpleTestCase):
+    """
+    Validators have to accept and reject the same requests, with the same
+    messages, with their compiled validators than with their forms only
+    """
+
+    @staticmethod
+    def get_error(validator, request) -> str:
+        try:
+            validator.validate(request)
+        except InvalidDataError as e:
+            return str(e)
+        return None
+
+    def get_form_error(self, validator, request) -> str:
+        with mock.patch(
+            'boatsandjoy_api.core.validators.compile_request_validator',
+            return_value=None,
+        ):
+            return self.get_error(validator, request)
+
+    def test_valid_requests(self):
+        for validator, request in VALID_REQUESTS:
+            with self.subTest(request=request):
+                request_validator = compile_request_validator(
+                    validator.FORM,
+                    type(request)
+                )
+
+                self.assertTrue(request_validator(request))
+                self.assertIsNone(self.get_form_error(validator, request))
+
+    def test_other_requests(self):
+        for validator, request in OTHER_REQUESTS:
+            with self.subTest(request=request):
+                request_validator = compile_request_validator(
+                    validator.FORM,
+                    type(request)
+                )
+
+                if request_validator:
+                    self.assertFalse(request_validator(request))
+                self.assertEqual(
+                    self.get_error(validator, request),
+                    self.get_form_error(validator, request)
+                )
+
+    def test_rejected_requests(self):
+        rejected = [
+            request
+            for validator, request in OTHER_REQUESTS
+            if self.get_form_error(validator, request)
+        ]
+
+        # Not only requests that the forms accept are compared
+        self.assertGreater(len(rejected), len(OTHER_REQUESTS) // 2)
@@ -1,8 +1,15 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache, partial
 
 from django import forms
 from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.mail import EmailMultiAlternatives
+from django.db import close_old_connections
 from django.template.loader import render_to_string
 
 
@@ -36,3 +43,40 @@ def send_email(
     )
     msg.attach_alternative(render_to_string(template, kwargs), 'text/html')
     msg.send()
+
+
+@lru_cache(maxsize=None)
+def get_thread_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.THREAD_POOL_MAX_WORKERS,
+        thread_name_prefix='boatsandjoy',
+    )
+
+
+async def run_in_thread_pool(func, *args, **kwargs):
+    """
+    Runs blocking code in the bounded thread pool without blocking the
+    event loop. Every thread keeps its own database connection
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_thread_pool(),
+        partial(_run_with_db_connections, func, *args, **kwargs),
+    )
+
+
+def _run_with_db_connections(func, *args, **kwargs):
+    # Same connections housekeeping that Django does around requests
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def is_cache_shared(alias: str = 'default') -> bool:
+    """
+    Tells if the cache is shared by all the processes of the app, local
+    memory and dummy caches are private to every process
+    """
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
@@ -1,7 +1,22 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from typing import (
+    Callable,
+    List,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from django import forms
 
 from .exceptions import InvalidDataError
+from .utils import MultipleIntField
 
 
 class RequestValidatorInterface(ABC):
@@ -16,10 +31,132 @@ class RequestValidatorInterface(ABC):
 
 
 class DjangoRequestValidator(RequestValidatorInterface):
+    """
+    Requests are checked first by a validator compiled once per request
+    class from its annotations and the fields of FORM. Only requests that
+    it can't accept (wrong types, missing values...) are validated by
+    FORM, which builds the error messages
+    """
+
     FORM = None
 
     @classmethod
     def validate(cls, request: dataclass):
+        request_validator = compile_request_validator(cls.FORM, type(request))
+        if request_validator and request_validator(request):
+            return
         form = cls.FORM(data=asdict(request))
         if not form.is_valid():
             raise InvalidDataError(f'Validation error {form.errors.as_text()}')
+
+
+@lru_cache(maxsize=None)
+def compile_request_validator(
+    form_class: type,
+    request_class: type
+) -> Optional[Callable]:
+    """
+    :return: a function that tells if every value of a request would be
+        accepted by the form without cleaning it or None when it can't be
+        known without the form
+    """
+    if form_class.clean is not forms.Form.clean:
+        return None
+    type_hints = get_type_hints(request_class)
+    request_fields = {field.name for field in fields(request_class)}
+    checks = []
+    for name, form_field in form_class.base_fields.items():
+        if name not in request_fields:
+            if form_field.required:
+                return None
+            continue
+        check = _get_value_check(form_field, type_hints[name])
+        if check is None:
+            return None
+        checks.append((name, form_field.required, check))
+
+    def validate_request(request: dataclass) -> bool:
+        for name, required, check in checks:
+            value = getattr(request, name)
+            if value is None:
+                if required:
+                    return False
+            elif not check(value, required):
+                return False
+        return True
+
+    return validate_request
+
+
+def _get_value_check(
+    form_field: forms.Field,
+    type_hint: any
+) -> Optional[Callable]:
+    if get_origin(type_hint) is Union:
+        args = [arg for arg in get_args(type_hint) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        type_hint = args[0]
+    field_class = type(form_field)
+    if field_class is forms.BooleanField and type_hint is bool:
+        return _check_bool
+    if field_class is forms.DateField and type_hint is date:
+        return _check_date
+    if (
+        field_class is forms.IntegerField
+        and type_hint is int
+        and not form_field.validators
+    ):
+        return _check_int
+    if (
+        field_class is forms.CharField
+        and type_hint is str
+        and form_field.max_length is None
+        and form_field.min_length is None
+        and form_field.strip
+    ):
+        return _check_str
+    if (
+        field_class is forms.DecimalField
+        and type_hint is Decimal
+        and form_field.max_value is None
+        and form_field.min_value is None
+        and form_field.max_digits is None
+        and form_field.decimal_places is None
+    ):
+        return _check_decimal
+    if field_class is MultipleIntField and type_hint == List[int]:
+        return _check_int_list
+    return None
+
+
+def _check_bool(value: any, required: bool) -> bool:
+    return isinstance(value, bool) and (value or not required)
+
+
+def _check_date(value: any, required: bool) -> bool:
+    return isinstance(value, date)
+
+
+def _check_int(value: any, required: bool) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_str(value: any, required: bool) -> bool:
+    return (
+        isinstance(value, str)
+        and '\x00' not in value
+        and (not required or bool(value.strip()))
+    )
+
+
+def _check_decimal(value: any, required: bool) -> bool:
+    return isinstance(value, Decimal) and value.is_finite()
+
+
+def _check_int_list(value: any, required: bool) -> bool:
+    return (
+        isinstance(value, list)
+        and (bool(value) or not required)
+        and all(_check_int(element, required) for element in value)
+    )
@@ -56,6 +56,21 @@ INSTALLED_APPS = [
     'health_check.storage',
 ]
 
+# REST FRAMEWORK CONFIGURATION
+# https://www.django-rest-framework.org/api-guide/settings/
+# ------------------------------------------------------------------------------
+JSON_RENDERER_CLASS = env(
+    'JSON_RENDERER_CLASS',
+    default='boatsandjoy_api.core.renderers.FastJSONRenderer'
+)
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        JSON_RENDERER_CLASS,
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
+}
+
 # DATABASE CONFIGURATION
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 # ------------------------------------------------------------------------------
@@ -71,6 +86,42 @@ DATABASES = {
     }
 }
 
+# CACHE CONFIGURATION
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+# ------------------------------------------------------------------------------
+# The local memory default is only right for a single process, cached day
+# availability responses are invalidated by changes made by other processes
+# (web workers, availability jobs workers) through a cache shared by all of
+# them (memcached, redis...)
+CACHES = {'default': env.cache('CACHE_URL', default='locmemcache://')}
+
+# Seconds that a day availability response is kept in cache, 0 disables it
+AVAILABILITY_CACHE_TIMEOUT = env.int('AVAILABILITY_CACHE_TIMEOUT', default=3600)
+
+# Generate availability with PostgreSQL generate_series instead of inserting
+# rows built in Python (ignored by other databases)
+AVAILABILITY_DATABASE_GENERATION = env.bool(
+    'AVAILABILITY_DATABASE_GENERATION',
+    default=False
+)
+
+# Build the slots read for availability from the day definitions and the
+# days booked slots masks instead of loading every slot row
+AVAILABILITY_DERIVED_SLOTS = env.bool(
+    'AVAILABILITY_DERIVED_SLOTS',
+    default=False
+)
+
+# Seconds that the process local snapshot of active boats is kept
+BOATS_CACHE_TIMEOUT = env.int('BOATS_CACHE_TIMEOUT', default=300)
+
+# Seconds that the process local day definitions and price variations
+# indexes are kept
+AVAILABILITY_INDEXES_TIMEOUT = env.int(
+    'AVAILABILITY_INDEXES_TIMEOUT',
+    default=300
+)
+
 # ADMIN CONFIGURATION
 # ------------------------------------------------------------------------------
 ADMIN_URL = 'admin/'
@@ -84,6 +135,21 @@ ROOT_URLCONF = 'config.urls'
 # ------------------------------------------------------------------------------
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# ASGI CONFIGURATION
+# https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+# ------------------------------------------------------------------------------
+ASGI_APPLICATION = 'config.asgi.application'
+
+# Serve availability endpoints with async views (for ASGI deployments)
+AVAILABILITY_ASYNC_VIEWS = env.bool('AVAILABILITY_ASYNC_VIEWS', default=False)
+
+# Serve the bookings endpoints that create Stripe checkout sessions with
+# async views (for ASGI deployments)
+BOOKINGS_ASYNC_VIEWS = env.bool('BOOKINGS_ASYNC_VIEWS', default=False)
+
+# Max threads used to run blocking code (ORM queries) from async code
+THREAD_POOL_MAX_WORKERS = env.int('THREAD_POOL_MAX_WORKERS', default=8)
+
 # GENERAL CONFIGURATION
 # ------------------------------------------------------------------------------
 # http://en.wikipedia.org/wiki/List_of_tz_zones_by_name
@@ -206,6 +272,14 @@ CORS_ORIGIN_ALLOW_ALL = True
 STRIPE_API_KEY = env('STRIPE_API_KEY', default='')
 STRIPE_SECRET_KEY = env('STRIPE_SECRET_KEY', default='')
 STRIPE_REDIRECT_URL = env('STRIPE_REDIRECT_URL', default='')
+# Seconds to wait for connecting to Stripe and for its responses
+STRIPE_CONNECT_TIMEOUT = env.float('STRIPE_CONNECT_TIMEOUT', default=3)
+STRIPE_READ_TIMEOUT = env.float('STRIPE_READ_TIMEOUT', default=15)
+# Connections to Stripe kept open to be reused between requests
+STRIPE_HTTP_POOL_SIZE = env.int(
+    'STRIPE_HTTP_POOL_SIZE',
+    default=THREAD_POOL_MAX_WORKERS
+)
 
 # EMAIL CONFIGURATION
 # ------------------------------------------------------------------------------